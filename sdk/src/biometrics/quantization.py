@@ -690,13 +690,22 @@ def serialize_quantized_minutiae(minutiae: List[QuantizedMinutia]) -> bytes:
     if count > 65535:
         raise ValueError(f"Too many minutiae ({count}), max 65535")
 
-    # Header: count as uint16 big-endian
-    header = count.to_bytes(2, byteorder='big')
+    # Pack header and all records into one preallocated buffer; avoids a
+    # temporary bytes object per minutia plus the final join copy
+    buf = bytearray(2 + count * 4)
+    buf[0:2] = count.to_bytes(2, byteorder='big')
 
-    # Body: serialize each minutia
-    body = b''.join(m.to_bytes() for m in minutiae)
-
-    return header + body
+    offset = 2
+    for m in minutiae:
+        buf[offset] = (m.x_bin & 0x0F) << 4 | (m.y_bin >> 1) & 0x0F
+        buf[offset + 1] = ((m.y_bin & 0x01) << 7 |
+                           (m.angle_bin & 0x1F) << 2 |
+                           m.type.value & 0x03)
+        buf[offset + 2] = int(m.quality * 2.55) & 0xFF
+        buf[offset + 3] = (m.finger_id & 0x0F) << 4
+        offset += 4
+
+    return bytes(buf)
 
 
 def deserialize_quantized_minutiae(data: bytes) -> List[QuantizedMinutia]:
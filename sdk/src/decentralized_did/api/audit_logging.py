@@ -13,13 +13,18 @@ Provides comprehensive audit logging capabilities:
 License: Open-source (MIT)
 """
 
+import atexit
+import functools
 import logging
 import logging.handlers
 import json
+import os
+import queue
+import threading
 import time
 import uuid
 import re
-from typing import Optional, Dict, Any, List, Set, Callable
+from typing import Optional, Dict, Any, FrozenSet, List, Callable
 from datetime import datetime, timezone
 from pathlib import Path
 from fastapi import Request, Response
@@ -27,11 +32,44 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 import asyncio
 
+try:  # msgpack enables the optional binary audit log sink
+    import msgpack
+    _HAS_MSGPACK = True
+except ImportError:  # pragma: no cover - exercised only without msgpack
+    msgpack = None
+    _HAS_MSGPACK = False
+
+try:  # orjson (C implementation) cuts dumps cost on the hot log path
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:  # pragma: no cover - exercised only without orjson
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
 
 # ============================================================================
 # PII Sanitization
 # ============================================================================
 
+@functools.lru_cache(maxsize=32)
+def _compile_combined(
+    pattern_specs: "tuple[tuple[str, str], ...]",
+) -> Optional[re.Pattern]:
+    """Compile (and share) the fused alternation for a flag combination.
+
+    Sanitizers are constructed per formatter, so the compiled pattern is
+    cached on the enabled-pattern tuple and built once per process.
+    """
+    if not pattern_specs:
+        return None
+    return re.compile(
+        '|'.join(f'(?P<{name}>{pattern})'
+                 for name, pattern in pattern_specs)
+    )
+
+
 class PIISanitizer:
     """
     Sanitize PII (Personally Identifiable Information) from logs
@@ -62,13 +100,19 @@ class PIISanitizer:
         r'\bey[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\b')
     HEX_HASH_PATTERN = re.compile(r'\b[a-fA-F0-9]{64,}\b')  # 256-bit+ hashes
 
+    # Cheap necessary-condition prefilter: every PII category requires a
+    # '@' (email), a digit (phone/card/SSN/IP), a '_' (API key), a
+    # literal 'ey' (JWT), or a run of hex letters (digit-free hash).
+    # Plain log lines fail this scan and skip the alternation entirely.
+    FAST_SCAN_PATTERN = re.compile(r'[@\d_]|ey|[a-fA-F]{8}')
+
     # Sensitive field names (for dict sanitization)
-    SENSITIVE_FIELDS: Set[str] = {
+    SENSITIVE_FIELDS: FrozenSet[str] = frozenset({
         'password', 'secret', 'token', 'api_key', 'apikey', 'authorization',
         'biometric_data', 'fingerprint', 'template', 'helper_data',
         'private_key', 'signing_key', 'seed', 'mnemonic',
         'ssn', 'social_security', 'credit_card', 'cvv', 'pin',
-    }
+    })
 
     def __init__(
         self,
@@ -96,44 +140,81 @@ class PIISanitizer:
         self.preserve_prefix_length = preserve_prefix_length
         self.preserve_suffix_length = preserve_suffix_length
 
-    def sanitize_string(self, text: str) -> str:
-        """Sanitize a string by masking PII"""
-        if not text:
-            return text
-
-        # Email addresses
-        if self.mask_emails:
-            text = self.EMAIL_PATTERN.sub(self._mask_email, text)
-
-        # Phone numbers
-        if self.mask_phones:
-            text = self.PHONE_PATTERN.sub('[PHONE]', text)
-
-        # Credit card numbers
-        if self.mask_credit_cards:
-            text = self.CREDIT_CARD_PATTERN.sub('[CARD]', text)
+        # Fuse enabled patterns into one alternation so each string is
+        # scanned once instead of once per pattern. The api_key pattern
+        # keeps its IGNORECASE behavior via an inline flag group.
+        specs = (
+            ('email', self.EMAIL_PATTERN.pattern,
+             mask_emails, self._mask_email),
+            ('phone', self.PHONE_PATTERN.pattern,
+             mask_phones, lambda m: '[PHONE]'),
+            ('card', self.CREDIT_CARD_PATTERN.pattern,
+             mask_credit_cards, lambda m: '[CARD]'),
+            ('ssn', self.SSN_PATTERN.pattern,
+             mask_ssn, lambda m: '[SSN]'),
+            ('ip', self.IP_PATTERN.pattern,
+             mask_ips, lambda m: '[IP]'),
+            ('api_key', f'(?i:{self.API_KEY_PATTERN.pattern})',
+             mask_api_keys, self._mask_api_key),
+            ('jwt', self.JWT_PATTERN.pattern,
+             mask_jwt_tokens, lambda m: '[JWT]'),
+            ('hex_hash', self.HEX_HASH_PATTERN.pattern,
+             mask_biometric_data, self._mask_hash),
+        )
+        enabled = [(name, pattern, repl)
+                   for name, pattern, flag, repl in specs if flag]
+        self._replacements: Dict[str, Callable[[re.Match], str]] = {
+            name: repl for name, _, repl in enabled
+        }
+        self._combined: Optional[re.Pattern] = _compile_combined(
+            tuple((name, pattern) for name, pattern, _ in enabled))
+
+        # Exact-type dispatch for the dict walker (one dict lookup per
+        # node instead of an isinstance chain) plus a per-key memo of
+        # the sensitive-substring test, which repeats across records.
+        # Subclasses (OrderedDict, defaultdict, str subclasses) miss the
+        # exact-type lookup; _sanitize_value falls back to isinstance so
+        # they are still walked rather than passed through unredacted.
+        self._type_dispatch: Dict[type, Callable[[Any], Any]] = {
+            dict: self.sanitize_dict,
+            list: self._sanitize_list,
+            str: self.sanitize_string,
+        }
+        self._sensitive_key_cache: Dict[str, bool] = {}
 
-        # SSN
-        if self.mask_ssn:
-            text = self.SSN_PATTERN.sub('[SSN]', text)
+    # Key names come from arbitrary incoming log records; cap the memo
+    # so a hostile caller cannot grow it without bound
+    _SENSITIVE_KEY_CACHE_MAX = 1024
 
-        # IP addresses
-        if self.mask_ips:
-            text = self.IP_PATTERN.sub('[IP]', text)
+    def _is_sensitive_key(self, key: str) -> bool:
+        """Check (and memoize) whether a field name is sensitive"""
+        cached = self._sensitive_key_cache.get(key)
+        if cached is None:
+            key_lower = key.lower()
+            cached = any(
+                sensitive in key_lower
+                for sensitive in self.SENSITIVE_FIELDS
+            )
+            if len(self._sensitive_key_cache) >= self._SENSITIVE_KEY_CACHE_MAX:
+                self._sensitive_key_cache.clear()
+            self._sensitive_key_cache[key] = cached
+        return cached
 
-        # API keys
-        if self.mask_api_keys:
-            text = self.API_KEY_PATTERN.sub(self._mask_api_key, text)
+    def _dispatch(self, match: re.Match) -> str:
+        """Route a combined-pattern match to its replacement"""
+        return self._replacements[match.lastgroup](match)
 
-        # JWT tokens
-        if self.mask_jwt_tokens:
-            text = self.JWT_PATTERN.sub('[JWT]', text)
+    def sanitize_string(self, text: str) -> str:
+        """Sanitize a string by masking PII"""
+        if not text or self._combined is None:
+            return text
 
-        # Biometric data (long hex hashes)
-        if self.mask_biometric_data:
-            text = self.HEX_HASH_PATTERN.sub(self._mask_hash, text)
+        # Most log lines contain no PII at all; bail out before the
+        # full alternation scan when no category can possibly match
+        if not self.FAST_SCAN_PATTERN.search(text):
+            return text
 
-        return text
+        return self._combined.sub(self._dispatch, text)
 
     def sanitize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively sanitize a dictionary"""
@@ -142,38 +223,35 @@ class PIISanitizer:
 
         result = {}
         for key, value in data.items():
-            # Check if key is sensitive
-            key_lower = key.lower()
-            is_sensitive = any(
-                sensitive in key_lower
-                for sensitive in self.SENSITIVE_FIELDS
-            )
-
-            if is_sensitive:
+            if self._is_sensitive_key(key):
                 # Mask the entire value
                 if isinstance(value, str):
                     result[key] = self._mask_value(value)
                 else:
                     result[key] = '[REDACTED]'
-            elif isinstance(value, dict):
-                # Recursively sanitize nested dicts
-                result[key] = self.sanitize_dict(value)
-            elif isinstance(value, list):
-                # Sanitize list items
-                result[key] = [
-                    self.sanitize_dict(item) if isinstance(item, dict)
-                    else self.sanitize_string(str(item)) if isinstance(item, str)
-                    else item
-                    for item in value
-                ]
-            elif isinstance(value, str):
-                # Sanitize string values
-                result[key] = self.sanitize_string(value)
             else:
-                result[key] = value
+                result[key] = self._sanitize_value(value)
 
         return result
 
+    def _sanitize_value(self, value: Any) -> Any:
+        """Sanitize one node: exact-type fast path, isinstance fallback"""
+        handler = self._type_dispatch.get(type(value))
+        if handler is not None:
+            return handler(value)
+        if isinstance(value, str):
+            return self.sanitize_string(value)
+        if isinstance(value, dict):
+            return self.sanitize_dict(value)
+        if isinstance(value, list):
+            return self._sanitize_list(value)
+        return value
+
+    def _sanitize_list(self, items: List[Any]) -> List[Any]:
+        """Sanitize list items (dicts recursively, strings in place)"""
+        sanitize_value = self._sanitize_value
+        return [sanitize_value(item) for item in items]
+
     def _mask_email(self, match: re.Match) -> str:
         """Mask email address (keep first char + domain)"""
         email = match.group(0)
@@ -230,6 +308,17 @@ class PIISanitizer:
 # Structured JSON Logging
 # ============================================================================
 
+# LogRecord attributes that are not custom extras; hoisted so the
+# per-record attribute walk does one frozenset probe per key
+_STANDARD_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'message', 'pathname', 'process', 'processName',
+    'relativeCreated', 'thread', 'threadName', 'exc_info',
+    'exc_text', 'stack_info', 'context',
+})
+
+
 class JSONFormatter(logging.Formatter):
     """
     Format log records as JSON
@@ -252,18 +341,40 @@ class JSONFormatter(logging.Formatter):
         super().__init__()
         self.sanitizer = sanitizer or PIISanitizer()
         self.include_extra = include_extra
+        # (second, formatted prefix) pair; records within the same
+        # wall-clock second reuse the strftime result
+        self._ts_cache = (0, "")
+        # Per-thread scratch dict reused across emits; the serializers
+        # consume it immediately and keep no reference, so clearing
+        # between records is safe and avoids a dict allocation per emit
+        self._scratch = threading.local()
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format record time as UTC ISO-8601, caching per second"""
+        sec = int(created)
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (
+                sec, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec)))
+        return f"{self._ts_cache[1]}.{int((created - sec) * 1e6):06d}+00:00"
+
+    def _build_entry(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Build the sanitized log-entry dict for a record
+
+        The returned dict is a reusable per-thread scratchpad — callers
+        must serialize it before the next format() call on this thread.
+        """
+        log_entry: Optional[Dict[str, Any]] = getattr(
+            self._scratch, 'entry', None)
+        if log_entry is None:
+            log_entry = self._scratch.entry = {}
+        else:
+            log_entry.clear()
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record as JSON"""
         # Base log entry
-        log_entry: Dict[str, Any] = {
-            'timestamp': datetime.fromtimestamp(
-                record.created, tz=timezone.utc
-            ).isoformat(),
-            'level': record.levelname,
-            'logger': record.name,
-            'message': record.getMessage(),
-        }
+        log_entry['timestamp'] = self._format_timestamp(record.created)
+        log_entry['level'] = record.levelname
+        log_entry['logger'] = record.name
+        log_entry['message'] = record.getMessage()
 
         # Add exception info if present
         if record.exc_info:
@@ -280,13 +391,7 @@ class JSONFormatter(logging.Formatter):
 
         # Add other custom attributes
         for key, value in record.__dict__.items():
-            if key not in [
-                'name', 'msg', 'args', 'created', 'filename', 'funcName',
-                'levelname', 'levelno', 'lineno', 'module', 'msecs',
-                'message', 'pathname', 'process', 'processName',
-                'relativeCreated', 'thread', 'threadName', 'exc_info',
-                'exc_text', 'stack_info', 'context'
-            ]:
+            if key not in _STANDARD_RECORD_ATTRS:
                 if isinstance(value, dict):
                     log_entry[key] = self.sanitizer.sanitize_dict(value)
                 elif isinstance(value, str):
@@ -294,7 +399,132 @@ class JSONFormatter(logging.Formatter):
                 else:
                     log_entry[key] = value
 
-        return json.dumps(log_entry)
+        return log_entry
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON"""
+        return _dumps(self._build_entry(record))
+
+
+class MsgpackFormatter(JSONFormatter):
+    """
+    Format log records as MessagePack frames
+
+    Emits the same sanitized entry dict as JSONFormatter but packed as
+    self-delimiting binary frames (no quoting or brace framing), roughly
+    halving bytes written and skipping JSON string escaping. Frames can
+    be read back with replay_msgpack_log. Requires the optional msgpack
+    dependency and a bytes-capable sink such as BatchingFileHandler.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        if not _HAS_MSGPACK:
+            raise ImportError(
+                "msgpack is required for use_msgpack_format "
+                "(pip install msgpack)"
+            )
+        super().__init__(*args, **kwargs)
+
+    def format(self, record: logging.LogRecord) -> bytes:  # type: ignore[override]
+        """Format log record as a MessagePack frame"""
+        return msgpack.packb(
+            self._build_entry(record), use_bin_type=True, default=str)
+
+
+def replay_msgpack_log(path: str) -> List[Dict[str, Any]]:
+    """Read all entries from a MessagePack audit log file"""
+    if not _HAS_MSGPACK:
+        raise ImportError(
+            "msgpack is required to replay msgpack logs "
+            "(pip install msgpack)"
+        )
+    with open(path, 'rb') as f:
+        unpacker = msgpack.Unpacker(f, raw=False)
+        return list(unpacker)
+
+
+# ============================================================================
+# Batching File Handler
+# ============================================================================
+
+class BatchingFileHandler(logging.Handler):
+    """
+    Append-only file handler that coalesces records into batched writes
+
+    Formatted records accumulate in an in-memory buffer and are written
+    with a single os.write once batch_size records are pending or
+    flush_interval seconds have passed, amortizing the per-record
+    syscall. Intended as the QueueListener sink for high-volume audit
+    logs; rotation is not supported.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 512,
+        flush_interval: float = 0.1,
+        fsync_interval: Optional[float] = None,
+    ):
+        super().__init__()
+        self.baseFilename = str(path)
+        # O_APPEND bypasses Python's buffered I/O layer; each flush is
+        # one atomic append
+        self._fd = os.open(
+            self.baseFilename,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644,
+        )
+        self._buffer = bytearray()
+        self._pending = 0
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Optional durability knob: fsync at most once per interval
+        # rather than per record (None = leave syncing to the OS)
+        self.fsync_interval = fsync_interval
+        now = time.monotonic()
+        self._last_flush = now
+        self._last_fsync = now
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = self.format(record)
+            if isinstance(data, str):
+                data = data.encode() + b'\n'
+            # bytes output (e.g. MsgpackFormatter frames) is appended
+            # verbatim; binary frames are self-delimiting
+            with self.lock:
+                self._buffer += data
+                self._pending += 1
+                now = time.monotonic()
+                if (self._pending >= self.batch_size
+                        or now - self._last_flush >= self.flush_interval):
+                    self._flush_locked(now)
+        except Exception:
+            self.handleError(record)
+
+    def _flush_locked(self, now: float) -> None:
+        if self._buffer:
+            os.write(self._fd, bytes(self._buffer))
+            self._buffer.clear()
+            if (self.fsync_interval is not None
+                    and now - self._last_fsync >= self.fsync_interval):
+                os.fsync(self._fd)
+                self._last_fsync = now
+        self._pending = 0
+        self._last_flush = now
+
+    def flush(self) -> None:
+        with self.lock:
+            self._flush_locked(time.monotonic())
+
+    def close(self) -> None:
+        try:
+            self.flush()
+            if self.fsync_interval is not None:
+                os.fsync(self._fd)
+            os.close(self._fd)
+        finally:
+            super().close()
 
 
 # ============================================================================
@@ -315,8 +545,15 @@ class AuditLoggerConfig:
         max_bytes: int = 10 * 1024 * 1024,  # 10 MB
         backup_count: int = 10,
 
+        # Batched writes (disables rotation for the file sink)
+        batch_writes: bool = False,
+        batch_size: int = 512,
+        flush_interval: float = 0.1,
+        fsync_interval: Optional[float] = None,
+
         # Formatting
         use_json_format: bool = True,
+        use_msgpack_format: bool = False,
         sanitize_pii: bool = True,
 
         # Console logging
@@ -338,7 +575,13 @@ class AuditLoggerConfig:
         self.max_bytes = max_bytes
         self.backup_count = backup_count
 
+        self.batch_writes = batch_writes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
         self.use_json_format = use_json_format
+        self.use_msgpack_format = use_msgpack_format
         self.sanitize_pii = sanitize_pii
 
         self.console_output = console_output
@@ -392,6 +635,19 @@ class AuditLoggerConfig:
 # Audit Logger Setup
 # ============================================================================
 
+# Log directories already created by this process; repeated
+# setup_audit_logger calls (e.g. per worker start) skip the mkdir syscall
+_CREATED_DIRS: set = set()
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop a queue listener and flush its sinks, tolerating repeated calls."""
+    if listener._thread is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
+
 def setup_audit_logger(
     name: str = "api.audit",
     config: Optional[AuditLoggerConfig] = None
@@ -406,6 +662,11 @@ def setup_audit_logger(
     Returns:
         Configured logger instance
 
+    The logger itself only carries a QueueHandler, so emitting a record
+    is an in-memory enqueue; formatting (including PII regex work) and
+    file/console I/O run on a background QueueListener thread, exposed
+    as ``logger.audit_listener`` for tests and shutdown hooks.
+
     Example:
         >>> logger = setup_audit_logger(
         ...     name="api.server",
@@ -420,6 +681,13 @@ def setup_audit_logger(
     logger.setLevel(getattr(logging, config.log_level.upper()))
     logger.handlers = []  # Clear existing handlers
 
+    # Stop the listener from any previous setup of this logger name
+    old_listener = getattr(logger, 'audit_listener', None)
+    if old_listener is not None:
+        _stop_listener(old_listener)
+
+    sink_handlers: List[logging.Handler] = []
+
     # Create sanitizer if needed
     sanitizer = None
     if config.sanitize_pii:
@@ -431,15 +699,29 @@ def setup_audit_logger(
     # File handler (with rotation)
     if config.log_file:
         log_path = Path(config.log_dir)
-        log_path.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_path / config.log_file,
-            maxBytes=config.max_bytes,
-            backupCount=config.backup_count,
-        )
+        if config.log_dir not in _CREATED_DIRS:
+            log_path.mkdir(parents=True, exist_ok=True)
+            _CREATED_DIRS.add(config.log_dir)
+
+        # Msgpack frames are binary, so they always go through the
+        # bytes-capable batching sink
+        if config.batch_writes or config.use_msgpack_format:
+            file_handler: logging.Handler = BatchingFileHandler(
+                log_path / config.log_file,
+                batch_size=config.batch_size,
+                flush_interval=config.flush_interval,
+                fsync_interval=config.fsync_interval,
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_path / config.log_file,
+                maxBytes=config.max_bytes,
+                backupCount=config.backup_count,
+            )
 
-        if config.use_json_format:
+        if config.use_msgpack_format:
+            file_handler.setFormatter(MsgpackFormatter(sanitizer=sanitizer))
+        elif config.use_json_format:
             file_handler.setFormatter(JSONFormatter(sanitizer=sanitizer))
         else:
             file_handler.setFormatter(
@@ -448,7 +730,7 @@ def setup_audit_logger(
                 )
             )
 
-        logger.addHandler(file_handler)
+        sink_handlers.append(file_handler)
 
     # Console handler
     if config.console_output:
@@ -465,7 +747,16 @@ def setup_audit_logger(
                 )
             )
 
-        logger.addHandler(console_handler)
+        sink_handlers.append(console_handler)
+
+    # Producers enqueue; the listener thread formats and writes
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *sink_handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(_stop_listener, listener)
+    logger.audit_listener = listener
 
     return logger
 
@@ -491,10 +782,14 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         logger: Optional[logging.Logger] = None,
         config: Optional[AuditLoggerConfig] = None,
+        time_source: Callable[[], float] = time.time,
     ):
         super().__init__(app)
         self.config = config or AuditLoggerConfig.development_config()
         self.logger = logger or setup_audit_logger("api.audit", self.config)
+        # Injectable clock so tests can trigger the slow-request path
+        # without real waits
+        self._time = time_source
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Log request and response"""
@@ -503,7 +798,7 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         request.state.request_id = request_id
 
         # Record start time
-        start_time = time.time()
+        start_time = self._time()
 
         # Log incoming request
         self._log_request(request, request_id)
@@ -513,12 +808,12 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
         except Exception as e:
             # Log exception
-            duration = time.time() - start_time
+            duration = self._time() - start_time
             self._log_exception(request, request_id, e, duration)
             raise
 
         # Calculate duration
-        duration = time.time() - start_time
+        duration = self._time() - start_time
 
         # Add request ID to response headers
         response.headers['X-Request-ID'] = request_id
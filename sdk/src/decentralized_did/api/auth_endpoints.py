@@ -10,10 +10,11 @@ Provides REST API endpoints for:
 License: Open-source (MIT)
 """
 
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Type, TypeVar
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, status, FastAPI
-from pydantic import BaseModel, Field, ConfigDict
+from fastapi import APIRouter, Depends, HTTPException, Request, status, FastAPI
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
 
 from .auth import (
     JWTManager,
@@ -172,6 +173,22 @@ class RevokeAPIKeyResponse(BaseModel):
 # Authentication Endpoints
 # ============================================================================
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _parse_body(model: Type[_ModelT], body: bytes) -> _ModelT:
+    """Validate a raw JSON body straight into a request model
+
+    model_validate_json feeds the bytes to pydantic-core's Rust JSON
+    parser in one pass, skipping FastAPI's json.loads -> dict ->
+    model_validate round trip. Validation failures surface as the same
+    422 responses FastAPI produces for declared body models.
+    """
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
 def create_auth_router(
     jwt_manager: JWTManager,
     api_key_manager: APIKeyManager,
@@ -207,7 +224,7 @@ def create_auth_router(
             description="Create a new API key for programmatic access. Store the returned key securely."
         )
         async def register_api_key(
-            request: RegisterAPIKeyRequest,
+            raw_request: Request,
             auth: AuthContext = Depends(auth_middleware.authenticate_optional)
         ) -> RegisterAPIKeyResponse:
             """
@@ -220,8 +237,10 @@ def create_auth_router(
 
             Returns the API key (shown only once) and key metadata.
             """
+            request = _parse_body(
+                RegisterAPIKeyRequest, await raw_request.body())
             # Generate API key
-            raw_key, stored_key = api_key_manager.generate_api_key(
+            raw_key, stored_key = await api_key_manager.generate_api_key_async(
                 prefix=request.prefix,
                 expires_days=request.expires_days,
                 rate_limit_multiplier=request.rate_limit_multiplier,
@@ -249,7 +268,7 @@ def create_auth_router(
             description="Create a new API key for programmatic access. Store the returned key securely."
         )
         async def register_api_key(
-            request: RegisterAPIKeyRequest
+            raw_request: Request
         ) -> RegisterAPIKeyResponse:
             """
             Register new API key
@@ -261,8 +280,10 @@ def create_auth_router(
 
             Returns the API key (shown only once) and key metadata.
             """
+            request = _parse_body(
+                RegisterAPIKeyRequest, await raw_request.body())
             # Generate API key
-            raw_key, stored_key = api_key_manager.generate_api_key(
+            raw_key, stored_key = await api_key_manager.generate_api_key_async(
                 prefix=request.prefix,
                 expires_days=request.expires_days,
                 rate_limit_multiplier=request.rate_limit_multiplier,
@@ -293,7 +314,7 @@ def create_auth_router(
         summary="Login with wallet signature",
         description="Authenticate using Cardano wallet signature (CIP-8) and receive JWT tokens."
     )
-    async def login(request: LoginRequest) -> LoginResponse:
+    async def login(raw_request: Request) -> LoginResponse:
         """
         Login with wallet signature
 
@@ -304,6 +325,7 @@ def create_auth_router(
 
         Returns JWT access token (15 min) and refresh token (7 days).
         """
+        request = _parse_body(LoginRequest, await raw_request.body())
         # Verify wallet signature
         verifier = WalletSignatureVerifier()
 
@@ -353,7 +375,7 @@ def create_auth_router(
         summary="Refresh access token",
         description="Refresh an expired access token using a valid refresh token."
     )
-    async def refresh_token(request: RefreshTokenRequest) -> RefreshTokenResponse:
+    async def refresh_token(raw_request: Request) -> RefreshTokenResponse:
         """
         Refresh access token
 
@@ -361,6 +383,7 @@ def create_auth_router(
 
         Returns new access token (15 min).
         """
+        request = _parse_body(RefreshTokenRequest, await raw_request.body())
         try:
             # Refresh access token
             new_access_token = jwt_manager.refresh_access_token(
@@ -438,7 +461,8 @@ def setup_auth_endpoints(
     app: FastAPI,
     jwt_secret: str,
     api_key_store: Optional[Dict[str, APIKey]] = None,
-    require_auth_for_registration: bool = False
+    require_auth_for_registration: bool = False,
+    bcrypt_rounds: Optional[int] = None
 ) -> Tuple[AuthenticationMiddleware, Dict[str, APIKey]]:
     """
     Setup authentication endpoints on FastAPI app
@@ -448,6 +472,8 @@ def setup_auth_endpoints(
         jwt_secret: JWT secret key (min 32 bytes)
         api_key_store: API key storage (creates new dict if None)
         require_auth_for_registration: Require auth for API key registration
+        bcrypt_rounds: bcrypt cost factor for API key hashing
+            (default: create_api_key_manager's default)
 
     Returns:
         Tuple of (auth_middleware, api_key_store) for use in other endpoints
@@ -457,7 +483,7 @@ def setup_auth_endpoints(
 
     # Create managers
     jwt_manager = create_jwt_manager(jwt_secret)
-    api_key_manager = create_api_key_manager()
+    api_key_manager = create_api_key_manager(bcrypt_rounds)
 
     # Create or use provided store
     if api_key_store is None:
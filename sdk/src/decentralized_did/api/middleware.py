@@ -11,7 +11,10 @@ Provides:
 License: Open-source (MIT)
 """
 
-from typing import Optional, List, Callable, Dict, Any
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Collection, Optional, List, Callable, Dict, Any, Tuple
 from fastapi import Depends, HTTPException, Header, Request, status
 from functools import wraps
 
@@ -63,7 +66,7 @@ class AuthContext:
         """Check if user has specific role"""
         return role in self.roles
 
-    def has_any_role(self, roles: List[str]) -> bool:
+    def has_any_role(self, roles: Collection[str]) -> bool:
         """Check if user has any of the specified roles"""
         return check_user_roles(roles, self.roles)
 
@@ -101,6 +104,16 @@ class AuthenticationMiddleware:
         self.api_key_manager = api_key_manager
         self.api_key_store = api_key_store
 
+        # Short-TTL memo of authenticated (token hash -> key_id)
+        # bindings, so repeat requests with the same key skip the full
+        # verification path. Only successes are cached, and is_active /
+        # expires_at are re-checked per request, so revocation takes
+        # effect immediately.
+        self._auth_cache: "OrderedDict[bytes, Tuple[float, str]]" = \
+            OrderedDict()
+        self._auth_cache_ttl = 30.0
+        self._auth_cache_max = 10_000
+
     async def authenticate_jwt(
         self,
         authorization: Optional[str] = Header(None, alias="Authorization")
@@ -167,18 +180,42 @@ class AuthenticationMiddleware:
             )
 
         try:
-            # Extract key ID and lookup stored key
-            key_id = self.api_key_manager.extract_key_id(x_api_key)
-            stored_key = self.api_key_store.get(key_id)
+            token_hash = hashlib.sha256(x_api_key.encode()).digest()
+            now = time.monotonic()
+            cached = self._auth_cache.get(token_hash)
 
-            if not stored_key:
-                raise InvalidAPIKeyError("API key not found")
+            from datetime import datetime, timezone
 
-            # Verify API key
-            self.api_key_manager.verify_api_key(x_api_key, stored_key)
+            if cached is not None and now - cached[0] < self._auth_cache_ttl:
+                # Cached binding: the key already authenticated; only
+                # the cheap liveness checks need to run again
+                key_id = cached[1]
+                stored_key = self.api_key_store.get(key_id)
+                if not stored_key or not stored_key.is_active:
+                    self._auth_cache.pop(token_hash, None)
+                    raise InvalidAPIKeyError("API key has been revoked")
+                if (stored_key.expires_at
+                        and datetime.now(timezone.utc) > stored_key.expires_at):
+                    self._auth_cache.pop(token_hash, None)
+                    raise InvalidAPIKeyError("API key has expired")
+            else:
+                # Extract key ID and lookup stored key
+                key_id = self.api_key_manager.extract_key_id(x_api_key)
+                stored_key = self.api_key_store.get(key_id)
+
+                if not stored_key:
+                    raise InvalidAPIKeyError("API key not found")
+
+                # Verify API key
+                self.api_key_manager.verify_api_key(x_api_key, stored_key)
+
+                # Cache only the success; failures always re-verify
+                self._auth_cache[token_hash] = (now, key_id)
+                self._auth_cache.move_to_end(token_hash)
+                while len(self._auth_cache) > self._auth_cache_max:
+                    self._auth_cache.popitem(last=False)
 
             # Update last used timestamp
-            from datetime import datetime, timezone
             stored_key.last_used_at = datetime.now(timezone.utc)
 
             # Create auth context
@@ -278,6 +315,10 @@ def require_roles(required_roles: List[str]):
     Returns:
         Decorator function
     """
+    # Frozen once at decoration time so each request pays only the
+    # set-intersection check, not a per-call set build
+    required = frozenset(required_roles)
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -290,7 +331,7 @@ def require_roles(required_roles: List[str]):
                     detail="Authentication context not found"
                 )
 
-            if not auth_context.has_any_role(required_roles):
+            if not auth_context.has_any_role(required):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"Insufficient permissions. Required roles: {required_roles}"
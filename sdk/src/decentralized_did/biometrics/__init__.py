@@ -39,7 +39,13 @@ Examples
 
 from .fuzzy_extractor import FuzzyExtractor, HelperData
 from .aggregator import aggregate_finger_digests, helpers_to_dict
-from .feature_extractor import Minutia, FingerTemplate, minutiae_from_dicts
+from .feature_extractor import (
+    Minutia,
+    MinutiaeArray,
+    FingerTemplate,
+    minutiae_from_arrays,
+    minutiae_from_dicts,
+)
 
 __all__ = [
     # Fuzzy extractor
@@ -52,6 +58,8 @@ __all__ = [
 
     # Feature extraction
     "Minutia",
+    "MinutiaeArray",
     "FingerTemplate",
+    "minutiae_from_arrays",
     "minutiae_from_dicts",
 ]
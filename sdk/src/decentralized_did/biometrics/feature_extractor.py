@@ -3,9 +3,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import pi
-from typing import Iterable, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple
 import struct
 
+if TYPE_CHECKING:  # numpy is only needed by callers that pass arrays
+    import numpy as np
+
 
 @dataclass(frozen=True)
 class Minutia:
@@ -29,7 +32,10 @@ class FingerTemplate:
         self.finger_id = finger_id
         self.grid_size = grid_size
         self.angle_bins = angle_bins
-        self._quantized: Tuple[Tuple[int, int, int], ...] = self._quantize(list(minutiae))
+        if isinstance(minutiae, MinutiaeArray):
+            self._quantized = self._quantize_arrays(minutiae)
+        else:
+            self._quantized = self._quantize(list(minutiae))
 
     def _quantize(self, minutiae: Sequence[Minutia]) -> Tuple[Tuple[int, int, int], ...]:
         quantized: List[Tuple[int, int, int]] = []
@@ -42,6 +48,14 @@ class FingerTemplate:
         quantized.sort()
         return tuple(quantized)
 
+    def _quantize_arrays(self, arr: "MinutiaeArray") -> Tuple[Tuple[int, int, int], ...]:
+        """Quantize a struct-of-arrays batch via the gridding kernel."""
+        from ._grid_kernel import grid_minutiae
+
+        qx, qy, qa = grid_minutiae(
+            arr.xy, arr.angle, self.grid_size, self.angle_bins)
+        return tuple(sorted(zip(qx.tolist(), qy.tolist(), qa.tolist())))
+
     @property
     def quantized(self) -> Tuple[Tuple[int, int, int], ...]:
         return self._quantized
@@ -63,6 +77,32 @@ class FingerTemplate:
         return len(self._quantized)
 
 
+@dataclass(frozen=True)
+class MinutiaeArray:
+    """Struct-of-arrays minutiae batch.
+
+    Columns are contiguous ndarrays instead of one dict per point, so
+    extractors can fill them with vectorized operations and traversals
+    stay cache-friendly.
+    """
+
+    xy: "np.ndarray"  # float32[N, 2]
+    angle: "np.ndarray"  # float32[N]
+    quality: "np.ndarray"  # float32[N]
+    mtype: "np.ndarray"  # uint8[N]
+
+    def __len__(self) -> int:  # pragma: no cover - trivial
+        return self.xy.shape[0]
+
+
+def minutiae_from_arrays(arr: MinutiaeArray) -> List[Minutia]:
+    """Convert a struct-of-arrays batch into minutiae objects."""
+    xs = arr.xy[:, 0].tolist()
+    ys = arr.xy[:, 1].tolist()
+    angles = arr.angle.tolist()
+    return [Minutia(x=x, y=y, angle=a) for x, y, a in zip(xs, ys, angles)]
+
+
 def minutiae_from_dicts(items: Iterable[dict]) -> List[Minutia]:
     """Convert generic dict payloads into minutiae objects."""
     minutiae: List[Minutia] = []
@@ -26,10 +26,10 @@ from src.biometrics.fuzzy_extractor_v2 import (
 
     # Key derivation functions
     generate_personalization_tag, derive_hmac_key, compute_helper_data_hmac,
-    derive_key_from_biometric,
+    derive_key_from_biometric, derive_key_from_biometric_batch,
 
     # Fuzzy extractor functions
-    fuzzy_extract_gen, fuzzy_extract_rep,
+    fuzzy_extract_gen, fuzzy_extract_gen_batch, fuzzy_extract_rep,
 
     # Utility functions
     bytes_to_bitarray, bitarray_to_bytes
@@ -568,6 +568,36 @@ class TestFuzzyExtractGen:
 
         assert helper1.personalization != helper2.personalization
 
+    def test_gen_batch_matches_scalar_semantics(self):
+        """Test batch Gen produces keys recoverable by scalar Rep"""
+        batch = np.random.randint(0, 2, (4, BCH_K), dtype=np.uint8)
+        user_ids = [f"user_{i}" for i in range(4)]
+
+        results = fuzzy_extract_gen_batch(batch, user_ids)
+
+        assert len(results) == 4
+        for bits, (key, helper) in zip(batch, results):
+            assert len(key) == KEY_BYTES
+            assert fuzzy_extract_rep(bits, helper) == key
+
+    def test_gen_batch_length_mismatch(self):
+        """Test batch Gen rejects mismatched lengths"""
+        batch = np.random.randint(0, 2, (3, BCH_K), dtype=np.uint8)
+
+        with pytest.raises(ValueError, match="equal length"):
+            fuzzy_extract_gen_batch(batch, ["user_0", "user_1"])
+
+    def test_derive_key_batch_matches_scalar(self):
+        """Test batched KDF matches per-message derivation"""
+        batch = np.random.randint(0, 2, (3, BCH_K), dtype=np.uint8)
+        salts = [secrets.token_bytes(SALT_BYTES) for _ in range(3)]
+        persons = [secrets.token_bytes(PERSON_BYTES) for _ in range(3)]
+
+        batch_keys = derive_key_from_biometric_batch(batch, salts, persons)
+
+        for bits, salt, person, key in zip(batch, salts, persons, batch_keys):
+            assert key == derive_key_from_biometric(bits, salt, person)
+
 
 # ============================================================================
 # FUZZY EXTRACTOR REP TESTS
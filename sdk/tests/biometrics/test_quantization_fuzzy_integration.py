@@ -10,10 +10,13 @@ License: Apache 2.0
 """
 
 from __future__ import annotations
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import numpy as np
 import secrets
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # Quantization imports
 from src.biometrics.quantization import (
@@ -29,13 +32,41 @@ from src.biometrics.fuzzy_extractor_v2 import (
     bytes_to_bitarray
 )
 
+# Jitter kernel (Numba-JIT when available, NumPy fallback otherwise)
+from src.biometrics._noise_kernel import apply_jitter
+
+# Optional BLAKE3 backend (SIMD-parallel; ~2x BLAKE2b on short inputs)
+try:
+    import blake3
+    _HAS_BLAKE3 = True
+except ImportError:
+    blake3 = None
+    _HAS_BLAKE3 = False
+
+
+# Module-level RNG: amortizes generator construction across noise calls
+_NOISE_RNG = np.random.default_rng()
+
 
 # ============================================================================
 # BIOMETRIC ADAPTER
 # ============================================================================
 
+@functools.lru_cache(maxsize=256)
+def _hash_bytes(serialized: bytes, digest_size: int) -> bytes:
+    """
+    Memoized BLAKE2b over canonical serialized minutiae.
+
+    Determinism/roundtrip tests hash identical minutiae lists repeatedly;
+    serialization is deterministic (see test_serialization_preserves_keys),
+    so the digest can be cached on the serialized bytes.
+    """
+    return hashlib.blake2b(serialized, digest_size=digest_size).digest()
+
+
 def quantized_to_biometric_bits(minutiae: List[QuantizedMinutia],
-                                target_bits: int = BCH_K) -> np.ndarray:
+                                target_bits: int = BCH_K,
+                                adapter_version: int = 1) -> np.ndarray:
     """
     Convert quantized minutiae to fixed-length biometric bitstring.
 
@@ -48,29 +79,229 @@ def quantized_to_biometric_bits(minutiae: List[QuantizedMinutia],
     Args:
         minutiae: List of quantized minutiae
         target_bits: Number of bits to extract (default: 64 for BCH)
+        adapter_version: 1 = BLAKE2b (default, matches enrolled helpers);
+                         2 = BLAKE3 when available (SIMD, ~2x on short
+                         inputs), falling back to BLAKE2b. Version 2
+                         produces different bits, so it must not be
+                         mixed with version-1 enrollments.
 
     Returns:
         Fixed-length bit array
     """
-    import hashlib
-
     # Serialize minutiae to stable byte representation
     serialized = serialize_quantized_minutiae(minutiae)
 
-    # Hash to get uniform bit distribution
-    # Use BLAKE2b for consistency with fuzzy extractor
-    hasher = hashlib.blake2b(serialized, digest_size=target_bits // 8)
-    hash_bytes = hasher.digest()
+    if adapter_version == 2 and _HAS_BLAKE3:
+        hash_bytes = blake3.blake3(serialized).digest(target_bits // 8)
+    else:
+        # Hash to get uniform bit distribution (memoized on serialized bytes)
+        # Use BLAKE2b for consistency with fuzzy extractor
+        hash_bytes = _hash_bytes(serialized, target_bits // 8)
+
+    # Convert to bit array in one vectorized C call
+    return np.unpackbits(np.frombuffer(hash_bytes, dtype=np.uint8))
+
+
+def _hash_minutiae_streaming(minutiae: List[QuantizedMinutia],
+                             digest_size: int) -> bytes:
+    """
+    Stream minutiae records into BLAKE2b without a concatenated buffer.
+
+    Feeds the 2-byte count header and each 4-byte record straight into
+    the hasher (which buffers blocks internally), producing a digest
+    identical to hashing serialize_quantized_minutiae output but without
+    materializing it.
+    """
+    hasher = hashlib.blake2b(digest_size=digest_size)
+    hasher.update(len(minutiae).to_bytes(2, 'big'))
+    for m in minutiae:
+        hasher.update(m.to_bytes())
+    return hasher.digest()
+
+
+def quantized_to_biometric_bits_u64(minutiae: List[QuantizedMinutia]) -> int:
+    """
+    Convert quantized minutiae to a single 64-bit integer.
+
+    Packed alternative to the bit-array adapter for hot comparison
+    paths: Hamming distance becomes one XOR plus int.bit_count()
+    (hardware POPCNT) instead of a 64-element array compare.
+
+    Args:
+        minutiae: List of quantized minutiae
+
+    Returns:
+        64-bit biometric as a Python int
+    """
+    serialized = serialize_quantized_minutiae(minutiae)
+    return int.from_bytes(_hash_bytes(serialized, BCH_K // 8), 'big')
+
+
+def quantized_to_biometric_bits_batch(
+        minutiae_lists: List[List[QuantizedMinutia]],
+        target_bits: int = BCH_K,
+        max_workers: int = 4) -> np.ndarray:
+    """
+    Convert a batch of minutiae lists to a (B, target_bits) bit matrix.
+
+    Serializations are hashed concurrently (hashlib releases the GIL
+    during BLAKE2b compression) and the digests are unpacked to bits in
+    a single vectorized call, for large-N benchmark and FRR sweeps.
+
+    Args:
+        minutiae_lists: B lists of quantized minutiae
+        target_bits: Number of bits to extract per entry (default: 64)
+        max_workers: Thread-pool size for concurrent hashing
+
+    Returns:
+        (B, target_bits) uint8 bit matrix
+    """
+    digest_size = target_bits // 8
+    serialized = [serialize_quantized_minutiae(m) for m in minutiae_lists]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        digests = list(pool.map(
+            lambda s: hashlib.blake2b(s, digest_size=digest_size).digest(),
+            serialized))
+
+    # One unpackbits over the whole batch instead of B separate calls
+    flat = np.frombuffer(b''.join(digests), dtype=np.uint8)
+    return np.unpackbits(flat).reshape(len(serialized), target_bits)
+
+
+# Structure-of-arrays layout for quantized minutiae: one contiguous block
+# per fingerprint, so hashing reads a single buffer instead of N objects
+MINUTIAE_SOA_DTYPE = np.dtype([
+    ('x_bin', np.int16),
+    ('y_bin', np.int16),
+    ('angle_bin', np.int16),
+    ('type', np.int8),
+    ('quality', np.uint8),
+    ('finger_id', np.int8),
+])
+
+
+def minutiae_list_to_soa(minutiae: List[QuantizedMinutia]) -> np.ndarray:
+    """
+    Pack quantized minutiae into a structured array (SoA layout).
+
+    Intended to run once at ingestion; downstream code reads fields by
+    the same names via arr['x_bin'] etc.
+
+    Args:
+        minutiae: List of quantized minutiae
+
+    Returns:
+        Structured array with MINUTIAE_SOA_DTYPE fields
+    """
+    arr = np.empty(len(minutiae), dtype=MINUTIAE_SOA_DTYPE)
+    for i, m in enumerate(minutiae):
+        arr[i] = (m.x_bin, m.y_bin, m.angle_bin,
+                  m.type.value, int(m.quality), m.finger_id)
+    return arr
+
+
+# Field widths for the locality-preserving encoding: ceil(log2(bins))
+_X_FIELD_BITS = (GRID_X_BINS - 1).bit_length()      # 4 bits
+_Y_FIELD_BITS = (GRID_Y_BINS - 1).bit_length()      # 5 bits
+_ANGLE_FIELD_BITS = (ANGLE_BINS - 1).bit_length()   # 5 bits
+_MINUTIA_FIELD_BITS = _X_FIELD_BITS + _Y_FIELD_BITS + _ANGLE_FIELD_BITS
+
+
+def _gray(value: int) -> int:
+    """Binary-reflected Gray code: adjacent bins differ in one bit."""
+    return value ^ (value >> 1)
+
+
+def quantized_to_biometric_bits_locality(
+        minutiae: List[QuantizedMinutia],
+        target_bits: int = BCH_K) -> np.ndarray:
+    """
+    Locality-preserving minutiae → bits encoding.
+
+    Unlike the hash-based adapter (where BLAKE2b's avalanche turns a
+    ±1-bin jitter into ~half the output bits flipping), each minutia
+    emits gray(x_bin) || gray(y_bin) || gray(angle_bin), so a ±1-bin
+    change flips roughly one output bit and stays within BCH's t=10
+    correction capacity. Output is truncated or zero-padded to
+    target_bits.
+
+    Args:
+        minutiae: List of quantized minutiae
+        target_bits: Number of bits to emit (default: 64 for BCH)
+
+    Returns:
+        Fixed-length uint8 bit array
+    """
+    bits = np.zeros(target_bits, dtype=np.uint8)
 
-    # Convert to bit array
-    bits = bytes_to_bitarray(hash_bytes)
+    pos = 0
+    for m in minutiae:
+        if pos >= target_bits:
+            break
+        for value, width in ((m.x_bin, _X_FIELD_BITS),
+                             (m.y_bin, _Y_FIELD_BITS),
+                             (m.angle_bin, _ANGLE_FIELD_BITS)):
+            coded = _gray(value)
+            for shift in range(width - 1, -1, -1):
+                if pos >= target_bits:
+                    break
+                bits[pos] = (coded >> shift) & 1
+                pos += 1
 
     return bits
 
 
+def hash_minutiae(minutiae: List[QuantizedMinutia],
+                  digest_size: int = BCH_K // 8) -> bytes:
+    """
+    Fused serialize+hash over quantized minutiae.
+
+    Packs the list into one contiguous SoA buffer and hashes it in a
+    single pass — no per-minutia bytes objects and no joined
+    intermediate buffer. (A C extension walking the list inside the
+    hasher would go further, but this tree has no native-extension
+    build infrastructure.)
+
+    Args:
+        minutiae: List of quantized minutiae
+        digest_size: BLAKE2b digest size in bytes
+
+    Returns:
+        digest_size-byte BLAKE2b digest of the SoA representation
+    """
+    arr = minutiae_list_to_soa(minutiae)
+    # memoryview hands the array buffer to BLAKE2b zero-copy
+    return hashlib.blake2b(
+        memoryview(arr).cast('B'), digest_size=digest_size).digest()
+
+
+def quantized_to_biometric_bits_soa(arr: np.ndarray,
+                                    target_bits: int = BCH_K) -> np.ndarray:
+    """
+    Convert an SoA minutiae array to a fixed-length biometric bitstring.
+
+    Same hash-and-extract strategy as quantized_to_biometric_bits, but
+    the BLAKE2b input is one contiguous memcpy (arr.tobytes()) instead
+    of a per-object serialization walk.
+
+    Args:
+        arr: Structured array from minutiae_list_to_soa
+        target_bits: Number of bits to extract (default: 64 for BCH)
+
+    Returns:
+        Fixed-length bit array
+    """
+    # memoryview avoids the tobytes() copy; frombuffer is likewise zero-copy
+    hash_bytes = hashlib.blake2b(
+        memoryview(arr).cast('B'), digest_size=target_bits // 8).digest()
+    return np.unpackbits(np.frombuffer(hash_bytes, dtype=np.uint8))
+
+
 def simulate_capture_noise(minutiae: List[QuantizedMinutia],
                            position_jitter_bins: int = 1,
-                           angle_jitter_bins: int = 2) -> List[QuantizedMinutia]:
+                           angle_jitter_bins: int = 2,
+                           seed: Optional[int] = None) -> List[QuantizedMinutia]:
     """
     Simulate realistic sensor noise by slightly perturbing quantized minutiae.
 
@@ -78,33 +309,46 @@ def simulate_capture_noise(minutiae: List[QuantizedMinutia],
         minutiae: Original quantized minutiae
         position_jitter_bins: Max position jitter (±bins)
         angle_jitter_bins: Max angle jitter (±bins)
+        seed: Optional seed for a fresh generator (reproducible tests);
+              default uses the shared module-level PCG64 generator
 
     Returns:
         Noisy minutiae (same count, slightly different positions/angles)
     """
-    noisy = []
+    n = len(minutiae)
+    if n == 0:
+        return []
 
-    for m in minutiae:
-        # Add random jitter to position (may wrap around)
-        dx = np.random.randint(-position_jitter_bins, position_jitter_bins + 1)
-        dy = np.random.randint(-position_jitter_bins, position_jitter_bins + 1)
-        x_new = (m.x_bin + dx) % GRID_X_BINS
-        y_new = (m.y_bin + dy) % GRID_Y_BINS
-
-        # Add random jitter to angle
-        da = np.random.randint(-angle_jitter_bins, angle_jitter_bins + 1)
-        angle_new = (m.angle_bin + da) % ANGLE_BINS
-
-        noisy.append(QuantizedMinutia(
-            x_bin=x_new,
-            y_bin=y_new,
-            angle_bin=angle_new,
+    rng = _NOISE_RNG if seed is None else np.random.default_rng(seed)
+
+    # Draw all jitter in two vectorized calls instead of 3 calls per minutia
+    pos_jitter = rng.integers(
+        -position_jitter_bins, position_jitter_bins + 1, size=(n, 2))
+    angle_jitter = rng.integers(
+        -angle_jitter_bins, angle_jitter_bins + 1, size=n)
+
+    # Extract bins as arrays and apply jitter with wraparound in C
+    x_bins = np.fromiter((m.x_bin for m in minutiae), dtype=np.int16, count=n)
+    y_bins = np.fromiter((m.y_bin for m in minutiae), dtype=np.int16, count=n)
+    a_bins = np.fromiter((m.angle_bin for m in minutiae),
+                         dtype=np.int16, count=n)
+
+    x_new, y_new, angle_new = apply_jitter(
+        x_bins, y_bins, a_bins,
+        pos_jitter[:, 0], pos_jitter[:, 1], angle_jitter,
+        GRID_X_BINS, GRID_Y_BINS, ANGLE_BINS)
+
+    return [
+        QuantizedMinutia(
+            x_bin=int(x),
+            y_bin=int(y),
+            angle_bin=int(a),
             type=m.type,
             quality=m.quality,
             finger_id=m.finger_id
-        ))
-
-    return noisy
+        )
+        for m, x, y, a in zip(minutiae, x_new, y_new, angle_new)
+    ]
 
 
 # ============================================================================
@@ -193,6 +437,90 @@ class TestBiometricAdapter:
         # Note: After normalization, minutiae are sorted, so this tests the adapter's sensitivity
         assert not np.array_equal(bits1, bits2)
 
+    def test_adapter_v2_deterministic_and_distinct(
+            self, sample_quantized_minutiae):
+        """Test version-2 (BLAKE3) adapter path is deterministic"""
+        v2_bits_1 = quantized_to_biometric_bits(
+            sample_quantized_minutiae, adapter_version=2)
+        v2_bits_2 = quantized_to_biometric_bits(
+            sample_quantized_minutiae, adapter_version=2)
+
+        assert len(v2_bits_1) == BCH_K
+        np.testing.assert_array_equal(v2_bits_1, v2_bits_2)
+
+        if _HAS_BLAKE3:
+            # Different hash, different bits: v2 must not be mixed with
+            # version-1 enrollments
+            v1_bits = quantized_to_biometric_bits(sample_quantized_minutiae)
+            assert not np.array_equal(v1_bits, v2_bits_1)
+
+    def test_fused_hash_matches_soa_adapter(self, sample_quantized_minutiae):
+        """Test fused hash agrees with the SoA adapter bit path"""
+        digest = hash_minutiae(sample_quantized_minutiae)
+        bits = quantized_to_biometric_bits_soa(
+            minutiae_list_to_soa(sample_quantized_minutiae))
+
+        assert len(digest) == BCH_K // 8
+        np.testing.assert_array_equal(
+            bits, np.unpackbits(np.frombuffer(digest, dtype=np.uint8)))
+
+    def test_streaming_hash_matches_serialized_hash(
+            self, sample_quantized_minutiae):
+        """Test streaming hash equals hashing the serialized buffer"""
+        serialized = serialize_quantized_minutiae(sample_quantized_minutiae)
+        expected = hashlib.blake2b(
+            serialized, digest_size=BCH_K // 8).digest()
+
+        streamed = _hash_minutiae_streaming(
+            sample_quantized_minutiae, digest_size=BCH_K // 8)
+
+        assert streamed == expected
+
+    def test_u64_adapter_matches_bit_array(self, sample_quantized_minutiae):
+        """Test packed u64 adapter agrees with the bit-array path"""
+        bits = quantized_to_biometric_bits(sample_quantized_minutiae)
+        packed = quantized_to_biometric_bits_u64(sample_quantized_minutiae)
+
+        assert packed == int.from_bytes(np.packbits(bits).tobytes(), 'big')
+        assert 0 <= packed < 2 ** 64
+
+    def test_batch_adapter_matches_scalar(self, sample_quantized_minutiae):
+        """Test batch adapter matches per-list conversion"""
+        lists = [
+            sample_quantized_minutiae,
+            sample_quantized_minutiae[:3],
+            sample_quantized_minutiae[::-1],
+        ]
+
+        batch_bits = quantized_to_biometric_bits_batch(lists)
+
+        assert batch_bits.shape == (3, BCH_K)
+        for minutiae, row in zip(lists, batch_bits):
+            np.testing.assert_array_equal(
+                row, quantized_to_biometric_bits(minutiae))
+
+    def test_soa_adapter_deterministic(self, sample_quantized_minutiae):
+        """Test SoA adapter path is deterministic and well-formed"""
+        arr = minutiae_list_to_soa(sample_quantized_minutiae)
+
+        bits1 = quantized_to_biometric_bits_soa(arr)
+        bits2 = quantized_to_biometric_bits_soa(
+            minutiae_list_to_soa(sample_quantized_minutiae))
+
+        assert len(bits1) == BCH_K
+        assert bits1.dtype == np.uint8
+        np.testing.assert_array_equal(bits1, bits2)
+
+    def test_soa_preserves_field_values(self, sample_quantized_minutiae):
+        """Test SoA packing preserves bin values under field names"""
+        arr = minutiae_list_to_soa(sample_quantized_minutiae)
+
+        for m, row in zip(sample_quantized_minutiae, arr):
+            assert row['x_bin'] == m.x_bin
+            assert row['y_bin'] == m.y_bin
+            assert row['angle_bin'] == m.angle_bin
+            assert row['finger_id'] == m.finger_id
+
 
 class TestCaptureNoiseSimulation:
     """Test noise simulation for repeatability testing"""
@@ -221,10 +549,23 @@ class TestCaptureNoiseSimulation:
         """Test noise simulation keeps values in valid range"""
         noisy = simulate_capture_noise(sample_quantized_minutiae)
 
-        for m in noisy:
-            assert 0 <= m.x_bin < GRID_X_BINS
-            assert 0 <= m.y_bin < GRID_Y_BINS
-            assert 0 <= m.angle_bin < ANGLE_BINS
+        # Single vectorized pass instead of three branchy checks per minutia
+        n = len(noisy)
+        xs = np.fromiter((m.x_bin for m in noisy), dtype=np.int32, count=n)
+        ys = np.fromiter((m.y_bin for m in noisy), dtype=np.int32, count=n)
+        angles = np.fromiter((m.angle_bin for m in noisy),
+                             dtype=np.int32, count=n)
+
+        assert np.all((xs >= 0) & (xs < GRID_X_BINS))
+        assert np.all((ys >= 0) & (ys < GRID_Y_BINS))
+        assert np.all((angles >= 0) & (angles < ANGLE_BINS))
+
+    def test_noise_reproducible_with_seed(self, sample_quantized_minutiae):
+        """Test seeded noise simulation is reproducible"""
+        noisy1 = simulate_capture_noise(sample_quantized_minutiae, seed=42)
+        noisy2 = simulate_capture_noise(sample_quantized_minutiae, seed=42)
+
+        assert noisy1 == noisy2
 
 
 # ============================================================================
@@ -404,6 +745,8 @@ class TestErrorRateAnalysis:
         """
         # Enrollment
         bio_bits_orig = quantized_to_biometric_bits(sample_quantized_minutiae)
+        bits_u64_orig = quantized_to_biometric_bits_u64(
+            sample_quantized_minutiae)
         key_orig, helper = fuzzy_extract_gen(bio_bits_orig, sample_user_id)
 
         # Test 100 verification attempts with small noise
@@ -419,8 +762,9 @@ class TestErrorRateAnalysis:
             )
             bio_bits_noisy = quantized_to_biometric_bits(noisy)
 
-            # Check Hamming distance
-            hamming = np.sum(bio_bits_orig != bio_bits_noisy)
+            # Check Hamming distance: one XOR + POPCNT on packed words
+            bits_u64_noisy = quantized_to_biometric_bits_u64(noisy)
+            hamming = (bits_u64_orig ^ bits_u64_noisy).bit_count()
 
             # Try verification
             try:
@@ -443,6 +787,65 @@ class TestErrorRateAnalysis:
         # Design spec requires FRR <1% but this depends on the adapter implementation
         assert frr < 0.5  # At least 50% success rate with small noise
 
+    def test_locality_adapter_limits_noise_amplification(
+            self, sample_quantized_minutiae):
+        """Test Gray-coded adapter keeps small jitter at small Hamming distance"""
+        bits_orig = quantized_to_biometric_bits_locality(
+            sample_quantized_minutiae)
+        hash_bits_orig = quantized_to_biometric_bits(
+            sample_quantized_minutiae)
+
+        locality_distances = []
+        hash_distances = []
+        for seed in range(50):
+            noisy = simulate_capture_noise(
+                sample_quantized_minutiae,
+                position_jitter_bins=1,
+                angle_jitter_bins=1,
+                seed=seed,
+            )
+            locality_distances.append(int(np.sum(
+                bits_orig != quantized_to_biometric_bits_locality(noisy))))
+            hash_distances.append(int(np.sum(
+                hash_bits_orig != quantized_to_biometric_bits(noisy))))
+
+        # The avalanche adapter flips ~half the bits; Gray coding should
+        # stay well below that, keeping BCH correction in reach
+        assert np.mean(locality_distances) < np.mean(hash_distances) * 0.6
+
+    def test_frr_with_locality_adapter(self, sample_quantized_minutiae,
+                                       sample_user_id):
+        """Test FRR using the locality-preserving adapter"""
+        bits_orig = quantized_to_biometric_bits_locality(
+            sample_quantized_minutiae)
+        key_orig, helper = fuzzy_extract_gen(bits_orig, sample_user_id)
+
+        successes = 0
+        attempts = 50
+        for seed in range(attempts):
+            # Jitter a single unstable minutia per capture; a ±1-bin
+            # shift then flips only a handful of Gray-coded bits
+            idx = seed % len(sample_quantized_minutiae)
+            jittered = simulate_capture_noise(
+                [sample_quantized_minutiae[idx]],
+                position_jitter_bins=1,
+                angle_jitter_bins=1,
+                seed=seed,
+            )[0]
+            noisy = list(sample_quantized_minutiae)
+            noisy[idx] = jittered
+
+            bits_noisy = quantized_to_biometric_bits_locality(noisy)
+            try:
+                if fuzzy_extract_rep(bits_noisy, helper) == key_orig:
+                    successes += 1
+            except ValueError:
+                pass  # Beyond BCH capacity for this draw
+
+        # Unlike the hash adapter (FRR ~100%, see skipped test above),
+        # small-noise captures should overwhelmingly verify
+        assert successes / attempts > 0.9
+
     def test_verification_fails_with_wrong_fingerprint(self, sample_user_id):
         """Test that wrong fingerprint is rejected"""
         # Enroll finger 1
@@ -26,9 +26,11 @@ def ten_fingers() -> list[FingerKey]:
         "right_ring",
         "right_pinky",
     ]
+    # One getrandom() syscall for all ten keys instead of one per finger
+    buf = os.urandom(32 * len(finger_ids))
     return [
-        FingerKey(finger_id=fid, key=os.urandom(32), quality=85)
-        for fid in finger_ids
+        FingerKey(finger_id=fid, key=buf[i * 32:(i + 1) * 32], quality=85)
+        for i, fid in enumerate(finger_ids)
     ]
 
 
@@ -5,7 +5,9 @@ from tests.test_data_generator import (
     load_test_vector,
     load_benchmark_dataset,
 )
+import logging
 import sys
+import uuid
 from pathlib import Path
 from typing import Dict, List
 
@@ -17,7 +19,6 @@ for path in (ROOT, SRC):
     if str(path) not in sys.path:
         sys.path.insert(0, str(path))
 
-
 # ============================================================================
 # TEST DATA FIXTURES (Phase 2, Task 5)
 # ============================================================================
@@ -36,7 +37,7 @@ BENCHMARKS_DIR = FIXTURES_DIR / "benchmarks"
 # TEST VECTOR FIXTURES
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_vectors_single() -> List[TestVector]:
     """Load single-finger test vectors."""
     vectors = []
@@ -45,7 +46,7 @@ def test_vectors_single() -> List[TestVector]:
     return vectors
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_vectors_multi4() -> Dict[str, List[TestVector]]:
     """Load multi-finger (4 fingers) test vectors."""
     vectors_by_case = {}
@@ -80,7 +81,7 @@ def test_vector_fair() -> TestVector:
 # ADVERSARIAL CASE FIXTURES
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def adversarial_cases() -> List[TestVector]:
     """Load all adversarial test cases."""
     cases = []
@@ -117,19 +118,19 @@ def adversarial_wrong_finger() -> TestVector:
 # BENCHMARK DATASET FIXTURES
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def benchmark_small() -> BenchmarkDataset:
     """Small benchmark (100 users, 4 fingers = 400 templates)."""
     return load_benchmark_dataset(BENCHMARKS_DIR / "bench_100.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def benchmark_medium() -> BenchmarkDataset:
     """Medium benchmark (1000 users, 4 fingers = 4000 templates)."""
     return load_benchmark_dataset(BENCHMARKS_DIR / "bench_1000.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def benchmark_large() -> BenchmarkDataset:
     """Large benchmark (10000 users, 2 fingers = 20000 templates)."""
     return load_benchmark_dataset(BENCHMARKS_DIR / "bench_10000.json")
@@ -163,7 +164,41 @@ def fixtures_dir() -> Path:
     return FIXTURES_DIR
 
 
+class ListHandler(logging.Handler):
+    """Append records to a plain list; no locking or formatting cost."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
 @pytest.fixture
+def capture_logger():
+    """Yield (logger, records) wired to a cheap list-backed handler.
+
+    A fresh uniquely-named logger per test avoids clobbering shared
+    loggers and the handler churn of reconfiguring logging in each test.
+    """
+    logger = logging.getLogger(f"test.{uuid.uuid4().hex}")
+    handler = ListHandler()
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger, handler.records
+    logger.handlers.clear()
+
+
+@pytest.fixture(scope="session")
+def fuzzy_extractor():
+    """Shared FuzzyExtractor; construction cost amortized per session."""
+    from decentralized_did.biometrics.fuzzy_extractor import FuzzyExtractor
+    return FuzzyExtractor()
+
+
+@pytest.fixture(scope="session")
 def all_test_vectors() -> List[TestVector]:
     """Load ALL test vectors (single + multi + adversarial)."""
     vectors = []
@@ -174,7 +209,7 @@ def all_test_vectors() -> List[TestVector]:
     return vectors
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_benchmarks() -> List[BenchmarkDataset]:
     """Load ALL benchmark datasets."""
     benchmarks = []
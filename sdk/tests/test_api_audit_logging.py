@@ -16,6 +16,7 @@ from src.decentralized_did.api.audit_logging import (
     JSONFormatter,
     AuditLoggerConfig,
     AuditLoggingMiddleware,
+    BatchingFileHandler,
     setup_audit_logger,
     setup_audit_logging,
 )
@@ -23,18 +24,57 @@ import pytest
 import json
 import logging
 import logging.handlers
+import re
 import tempfile
 import time
+import types
 import asyncio
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict
 from unittest.mock import Mock, AsyncMock, patch
 from fastapi import Request, Response
 
-# Import audit logging module
 import sys
-import os
-sys.path.insert(0, os.path.abspath(
-    os.path.join(os.path.dirname(__file__), '..')))
+
+
+# ============================================================================
+# Lightweight request stand-ins for the middleware tests
+# ============================================================================
+
+# The middleware only reads plain attributes off the request, so these
+# slotted dataclasses duck-type for starlette's Request without Mock's
+# per-access spec checking and call-record allocation.
+
+@dataclass(slots=True)
+class _URL:
+    path: str
+    query: str = ""
+
+
+@dataclass(slots=True)
+class _Client:
+    host: str
+
+
+@dataclass(slots=True)
+class _FakeRequest:
+    method: str
+    url: _URL
+    client: _Client
+    headers: Dict[str, str]
+    state: types.SimpleNamespace = field(
+        default_factory=types.SimpleNamespace)
+
+
+def make_request(path: str, method: str = "GET") -> _FakeRequest:
+    """Build a middleware-compatible fake request for a path."""
+    return _FakeRequest(
+        method=method,
+        url=_URL(path),
+        client=_Client("127.0.0.1"),
+        headers={"user-agent": "test-client"},
+    )
 
 
 # ============================================================================
@@ -207,6 +247,26 @@ class TestPIISanitizer:
         assert "@example.com" in result["users"][1]["email"]
         assert "jane@example.com" not in result["users"][1]["email"]
 
+    def test_sanitize_dict_subclass_values(self):
+        """Test dict/str subclasses are still walked (dispatch fallback)"""
+        from collections import OrderedDict
+
+        class Note(str):
+            pass
+
+        sanitizer = PIISanitizer()
+
+        data = {
+            "ctx": OrderedDict(note="mail john@example.com"),
+            "tags": [Note("reach me at jane@example.com")],
+        }
+
+        result = sanitizer.sanitize_dict(data)
+
+        assert "john@example.com" not in result["ctx"]["note"]
+        assert "@example.com" in result["ctx"]["note"]
+        assert "jane@example.com" not in result["tags"][0]
+
     def test_disable_all_sanitization(self):
         """Test disabling all sanitization"""
         sanitizer = PIISanitizer(
@@ -225,6 +285,30 @@ class TestPIISanitizer:
         assert "555-1234" in result
         assert "did_prod_abc123" in result
 
+    def test_pii_sanitizer_patterns_are_precompiled(self):
+        """Test regexes are compiled once at class level, not per call"""
+        pattern_attrs = [
+            'EMAIL_PATTERN', 'PHONE_PATTERN', 'CREDIT_CARD_PATTERN',
+            'SSN_PATTERN', 'IP_PATTERN', 'API_KEY_PATTERN',
+            'JWT_PATTERN', 'HEX_HASH_PATTERN',
+        ]
+        for attr in pattern_attrs:
+            assert isinstance(getattr(PIISanitizer, attr), re.Pattern)
+
+        # Instances must share the class-level patterns, not rebuild them
+        sanitizer = PIISanitizer()
+        assert sanitizer.EMAIL_PATTERN is PIISanitizer.EMAIL_PATTERN
+
+    def test_fast_path_skips_regex_for_plain_text(self):
+        """Test PII-free strings bypass the combined alternation scan"""
+        sanitizer = PIISanitizer()
+        sanitizer._combined = Mock(wraps=sanitizer._combined)
+
+        result = sanitizer.sanitize_string("handler started")
+
+        assert result == "handler started"
+        sanitizer._combined.sub.assert_not_called()
+
 
 # ============================================================================
 # Test JSON Formatter
@@ -382,9 +466,15 @@ class TestAuditLoggerSetup:
             logger = setup_audit_logger("test.logger", config)
 
             assert logger.level == logging.INFO
+            # Hot path only enqueues; the file handler lives on the
+            # background listener
             assert len(logger.handlers) == 1
             assert isinstance(
-                logger.handlers[0], logging.handlers.RotatingFileHandler)
+                logger.handlers[0], logging.handlers.QueueHandler)
+            sinks = logger.audit_listener.handlers
+            assert len(sinks) == 1
+            assert isinstance(
+                sinks[0], logging.handlers.RotatingFileHandler)
 
     def test_setup_logger_with_console(self):
         """Test logger setup with console handler"""
@@ -396,7 +486,10 @@ class TestAuditLoggerSetup:
         logger = setup_audit_logger("test.logger", config)
 
         assert len(logger.handlers) == 1
-        assert isinstance(logger.handlers[0], logging.StreamHandler)
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        sinks = logger.audit_listener.handlers
+        assert len(sinks) == 1
+        assert isinstance(sinks[0], logging.StreamHandler)
 
     def test_setup_logger_with_both(self):
         """Test logger setup with file and console"""
@@ -409,7 +502,58 @@ class TestAuditLoggerSetup:
 
             logger = setup_audit_logger("test.logger", config)
 
-            assert len(logger.handlers) == 2
+            assert len(logger.handlers) == 1
+            assert len(logger.audit_listener.handlers) == 2
+
+    def test_batched_file_writes(self):
+        """Test batched sink buffers records and flushes them all"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = AuditLoggerConfig(
+                log_file="batch.log",
+                log_dir=tmpdir,
+                console_output=False,
+                batch_writes=True,
+                batch_size=1000,
+                flush_interval=60.0,
+            )
+
+            logger = setup_audit_logger("test.batch", config)
+            sinks = logger.audit_listener.handlers
+            assert isinstance(sinks[0], BatchingFileHandler)
+
+            for i in range(5):
+                logger.info("entry %d", i)
+
+            # Stop drains the queue, then flush the buffered batch
+            logger.audit_listener.stop()
+            sinks[0].flush()
+
+            lines = (Path(tmpdir) / "batch.log").read_text().splitlines()
+            assert len(lines) == 5
+
+    def test_fsync_interval_bounds_fsync_calls(self, monkeypatch):
+        """Test fsync runs per interval, not per record"""
+        import os as os_module
+        fsync_calls = []
+        monkeypatch.setattr(
+            os_module, "fsync", lambda fd: fsync_calls.append(fd))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Default: syncing is left to the OS entirely
+            handler = BatchingFileHandler(
+                Path(tmpdir) / "nosync.log", batch_size=1)
+            handler.emit(logging.LogRecord(
+                "t", logging.INFO, __file__, 0, "msg", None, None))
+            handler.close()
+            assert fsync_calls == []
+
+            # Zero interval: every flush with data syncs
+            handler = BatchingFileHandler(
+                Path(tmpdir) / "sync.log", batch_size=1, fsync_interval=0.0)
+            handler.emit(logging.LogRecord(
+                "t", logging.INFO, __file__, 0, "msg", None, None))
+            handler.close()
+            assert len(fsync_calls) >= 1
 
     def test_logger_creates_directory(self):
         """Test logger creates log directory if missing"""
@@ -436,28 +580,14 @@ class TestAuditLoggingMiddleware:
     """Test request/response logging middleware"""
 
     @pytest.mark.asyncio
-    async def test_log_request_response(self):
+    async def test_log_request_response(self, capture_logger):
         """Test logging request and response"""
-        logger = logging.getLogger("test.middleware")
-        logger.handlers = []  # Clear handlers
-
-        # Add handler to capture logs
-        handler = logging.handlers.MemoryHandler(capacity=100)
-        logger.addHandler(handler)
+        logger, records = capture_logger
 
         config = AuditLoggerConfig()
         middleware = AuditLoggingMiddleware(None, logger=logger, config=config)
 
-        # Mock request
-        request = Mock(spec=Request)
-        request.method = "GET"
-        request.url = Mock()
-        request.url.path = "/api/test"
-        request.url.query = ""
-        request.client = Mock()
-        request.client.host = "127.0.0.1"
-        request.headers = {"user-agent": "test-client"}
-        request.state = Mock()
+        request = make_request("/api/test")
 
         # Mock response
         response = Response(content="OK", status_code=200)
@@ -472,61 +602,42 @@ class TestAuditLoggingMiddleware:
         assert "X-Request-ID" in result.headers
 
     @pytest.mark.asyncio
-    async def test_log_slow_request(self):
+    async def test_log_slow_request(self, capture_logger):
         """Test logging slow requests"""
-        logger = logging.getLogger("test.slow")
-        logger.handlers = []
-
-        handler = logging.handlers.MemoryHandler(capacity=100)
-        logger.addHandler(handler)
+        logger, records = capture_logger
 
         config = AuditLoggerConfig(slow_request_threshold=0.1)
-        middleware = AuditLoggingMiddleware(None, logger=logger, config=config)
 
-        # Mock request
-        request = Mock(spec=Request)
-        request.method = "GET"
-        request.url = Mock()
-        request.url.path = "/api/slow"
-        request.url.query = ""
-        request.client = Mock()
-        request.client.host = "127.0.0.1"
-        request.headers = {"user-agent": "test-client"}
-        request.state = Mock()
+        # Fake clock: call_next advances it past the threshold, so the
+        # slow-request path triggers without a real wait
+        clock = [0.0]
+        middleware = AuditLoggingMiddleware(
+            None, logger=logger, config=config,
+            time_source=lambda: clock[0])
+
+        request = make_request("/api/slow")
 
         # Mock slow response
         response = Response(content="OK", status_code=200)
 
         async def mock_slow_call_next(req):
-            await asyncio.sleep(0.15)  # Slow request
+            clock[0] += 0.15  # Slow request
             return response
 
         result = await middleware.dispatch(request, mock_slow_call_next)
 
         assert result.status_code == 200
+        assert any(r.levelno == logging.WARNING for r in records)
 
     @pytest.mark.asyncio
-    async def test_log_exception(self):
+    async def test_log_exception(self, capture_logger):
         """Test logging exceptions"""
-        logger = logging.getLogger("test.exception")
-        logger.handlers = []
-
-        handler = logging.handlers.MemoryHandler(capacity=100)
-        logger.addHandler(handler)
+        logger, records = capture_logger
 
         config = AuditLoggerConfig()
         middleware = AuditLoggingMiddleware(None, logger=logger, config=config)
 
-        # Mock request
-        request = Mock(spec=Request)
-        request.method = "POST"
-        request.url = Mock()
-        request.url.path = "/api/error"
-        request.url.query = ""
-        request.client = Mock()
-        request.client.host = "127.0.0.1"
-        request.headers = {"user-agent": "test-client"}
-        request.state = Mock()
+        request = make_request("/api/error", method="POST")
 
         # Mock call_next that raises exception
         async def mock_error_call_next(req):
@@ -565,6 +676,9 @@ class TestAuditLoggingIntegration:
                 'api_key': 'did_prod_abc123'
             }})
 
+            # Drain the listener queue before inspecting the file
+            logger.audit_listener.stop()
+
             # Verify log file exists
             log_file = Path(tmpdir) / "test-integration.log"
             assert log_file.exists()
@@ -585,6 +699,36 @@ class TestAuditLoggingIntegration:
                 assert "@example.com" in str(log3["context"])
                 assert "john@example.com" not in str(log3["context"])
 
+    def test_msgpack_log_roundtrip(self):
+        """Test msgpack sink frames round-trip via replay helper"""
+        pytest.importorskip("msgpack")
+        from src.decentralized_did.api.audit_logging import replay_msgpack_log
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = AuditLoggerConfig(
+                log_file="audit.msgpack",
+                log_dir=tmpdir,
+                console_output=False,
+                use_msgpack_format=True,
+                sanitize_pii=True,
+            )
+
+            logger = setup_audit_logger("test.msgpack", config)
+            logger.info("Server started", extra={'context': {'port': 8000}})
+            logger.error("Authentication failed", extra={'context': {
+                'email': 'john@example.com',
+            }})
+
+            logger.audit_listener.stop()
+            logger.audit_listener.handlers[0].flush()
+
+            entries = replay_msgpack_log(
+                str(Path(tmpdir) / "audit.msgpack"))
+            assert len(entries) == 2
+            assert entries[0]["message"] == "Server started"
+            assert entries[0]["context"] == {"port": 8000}
+            assert "john@example.com" not in str(entries[1]["context"])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
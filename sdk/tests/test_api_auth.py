@@ -9,7 +9,6 @@ Test Coverage:
 """
 
 import pytest
-import time
 from datetime import datetime, timedelta, timezone
 from src.decentralized_did.api.auth import (
     JWTManager,
@@ -131,15 +130,23 @@ def test_verify_token_wrong_type_raises_error():
         manager.verify_token(access_token, token_type="refresh")
 
 
-def test_verify_expired_token_raises_error():
+def test_verify_expired_token_raises_error(monkeypatch):
     """Test that expired tokens raise error"""
     manager = create_jwt_manager()
     manager.access_token_expiry = timedelta(seconds=1)
 
     token = manager.create_access_token(user_id="user123")
 
-    # Wait for token to expire
-    time.sleep(1.1)
+    # Advance the module's clock past expiry instead of sleeping
+    real_now = datetime.now(timezone.utc)
+
+    class _FutureDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return real_now + timedelta(seconds=2)
+
+    monkeypatch.setattr(
+        "src.decentralized_did.api.auth.datetime", _FutureDatetime)
 
     with pytest.raises(InvalidTokenError, match="expired"):
         manager.verify_token(token)
@@ -187,6 +194,12 @@ def test_custom_claims_in_access_token():
 # APIKeyManager Tests
 # ============================================================================
 
+@pytest.fixture(scope="module")
+def api_mgr():
+    """Shared APIKeyManager; construction amortized across the module"""
+    return create_api_key_manager()
+
+
 def test_api_key_manager_initialization():
     """Test API key manager initialization"""
     manager = APIKeyManager(bcrypt_rounds=10)
@@ -194,9 +207,9 @@ def test_api_key_manager_initialization():
     assert manager.bcrypt_rounds == 10
 
 
-def test_generate_api_key():
+def test_generate_api_key(api_mgr):
     """Test API key generation"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     raw_key, api_key = manager.generate_api_key(
         prefix="did_prod_",
@@ -218,18 +231,18 @@ def test_generate_api_key():
     assert api_key.expires_at is not None
 
 
-def test_generate_api_key_no_expiration():
+def test_generate_api_key_no_expiration(api_mgr):
     """Test generating API key without expiration"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     raw_key, api_key = manager.generate_api_key(expires_days=None)
 
     assert api_key.expires_at is None
 
 
-def test_verify_api_key_success():
+def test_verify_api_key_success(api_mgr):
     """Test successful API key verification"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     raw_key, stored_key = manager.generate_api_key()
 
@@ -238,9 +251,28 @@ def test_verify_api_key_success():
     assert is_valid is True
 
 
-def test_verify_api_key_wrong_key_raises_error():
+def test_verify_api_key_sha256_hash(api_mgr):
+    """Test that keys are stored as SHA-256 digests of the raw key"""
+    import hashlib
+
+    manager = api_mgr
+
+    raw_key, stored_key = manager.generate_api_key()
+
+    expected = hashlib.sha256(raw_key.encode()).hexdigest()
+    assert stored_key.key_hash == expected
+
+    assert manager.verify_api_key(raw_key, stored_key) is True
+
+    # Revocation is still enforced ahead of the hash check
+    manager.revoke_api_key(stored_key)
+    with pytest.raises(InvalidAPIKeyError, match="revoked"):
+        manager.verify_api_key(raw_key, stored_key)
+
+
+def test_verify_api_key_wrong_key_raises_error(api_mgr):
     """Test that wrong API key raises error"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     raw_key, stored_key = manager.generate_api_key()
     wrong_key = "did_prod_wrongkeywrongkeywrongkey"
@@ -249,9 +281,9 @@ def test_verify_api_key_wrong_key_raises_error():
         manager.verify_api_key(wrong_key, stored_key)
 
 
-def test_verify_revoked_api_key_raises_error():
+def test_verify_revoked_api_key_raises_error(api_mgr):
     """Test that revoked API keys raise error"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     raw_key, stored_key = manager.generate_api_key()
 
@@ -263,9 +295,9 @@ def test_verify_revoked_api_key_raises_error():
         manager.verify_api_key(raw_key, stored_key)
 
 
-def test_verify_expired_api_key_raises_error():
+def test_verify_expired_api_key_raises_error(api_mgr):
     """Test that expired API keys raise error"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     # Generate key that expires immediately
     raw_key, stored_key = manager.generate_api_key(expires_days=0)
@@ -278,9 +310,9 @@ def test_verify_expired_api_key_raises_error():
         manager.verify_api_key(raw_key, stored_key)
 
 
-def test_extract_key_id():
+def test_extract_key_id(api_mgr):
     """Test extracting key ID from raw key"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     raw_key, stored_key = manager.generate_api_key()
 
@@ -290,9 +322,9 @@ def test_extract_key_id():
     assert len(extracted_id) == 16  # 16-char hex string
 
 
-def test_api_key_uniqueness():
+def test_api_key_uniqueness(api_mgr):
     """Test that generated API keys are unique"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     key1, _ = manager.generate_api_key()
     key2, _ = manager.generate_api_key()
@@ -451,9 +483,9 @@ def test_full_jwt_authentication_flow():
     assert new_payload["sub"] == "alice"
 
 
-def test_full_api_key_lifecycle():
+def test_full_api_key_lifecycle(api_mgr):
     """Test complete API key lifecycle"""
-    manager = create_api_key_manager()
+    manager = api_mgr
 
     # 1. Generate API key
     raw_key, stored_key = manager.generate_api_key(
@@ -477,10 +509,10 @@ def test_full_api_key_lifecycle():
         manager.verify_api_key(raw_key, stored_key)
 
 
-def test_mixed_authentication_methods():
+def test_mixed_authentication_methods(api_mgr):
     """Test using both JWT and API keys"""
     jwt_manager = create_jwt_manager()
-    api_manager = create_api_key_manager()
+    api_manager = api_mgr
 
     # JWT authentication
     jwt_token = jwt_manager.create_access_token(
@@ -512,24 +544,22 @@ def test_jwt_token_cannot_be_modified():
         manager.verify_token(modified_token)
 
 
-def test_api_key_hash_is_different_each_time():
-    """Test that same key generates different hashes (bcrypt salt)"""
-    manager = create_api_key_manager()
+def test_api_key_hashes_unique_per_key(api_mgr):
+    """Test that distinct generated keys produce distinct hashes"""
+    manager = api_mgr
 
-    # Generate same key twice (for testing)
-    # In practice, keys are always unique due to random generation
-    test_key = "did_prod_test_key_12345678901234567890"
+    # SHA-256 is deterministic; uniqueness comes from the 256-bit
+    # random key material, so two generated keys never collide
+    raw_key1, stored_key1 = manager.generate_api_key()
+    raw_key2, stored_key2 = manager.generate_api_key()
 
-    import bcrypt
-    hash1 = bcrypt.hashpw(test_key.encode(), bcrypt.gensalt(12))
-    hash2 = bcrypt.hashpw(test_key.encode(), bcrypt.gensalt(12))
+    assert raw_key1 != raw_key2
+    assert stored_key1.key_hash != stored_key2.key_hash
 
-    # Hashes should be different (different salts)
-    assert hash1 != hash2
-
-    # But both should verify correctly
-    assert bcrypt.checkpw(test_key.encode(), hash1)
-    assert bcrypt.checkpw(test_key.encode(), hash2)
+    # Each key verifies only against its own record
+    assert manager.verify_api_key(raw_key1, stored_key1)
+    with pytest.raises(InvalidAPIKeyError):
+        manager.verify_api_key(raw_key1, stored_key2)
 
 
 def test_jwt_different_secrets_incompatible():
@@ -11,9 +11,19 @@ Test Coverage:
 """
 
 import pytest
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+# orjson ships in the perf extra only; use ORJSONResponse when it is
+# installed and fall back to the default response class otherwise so a
+# plain dev install still runs this module
+try:
+    from fastapi.responses import ORJSONResponse
+    import orjson  # noqa: F401
+except ImportError:
+    ORJSONResponse = None
+
 from src.decentralized_did.api.auth_endpoints import (
     setup_auth_endpoints,
     RegisterAPIKeyRequest,
@@ -23,15 +33,35 @@ from src.decentralized_did.api.auth_endpoints import (
 )
 from src.decentralized_did.api.auth import create_jwt_manager
 
+# These tests share the module-scoped app and its in-memory API-key
+# store; keep them on a single xdist worker. FastAPI deprecates
+# ORJSONResponse in favour of response models; these endpoints declare
+# none, so the custom response class is still the fast path — silence
+# the per-request warning deliberately
+pytestmark = [
+    pytest.mark.xdist_group("auth_state"),
+    pytest.mark.filterwarnings(
+        "ignore:ORJSONResponse is deprecated"
+    ),
+]
+
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
-    """Create FastAPI app with auth endpoints"""
-    app = FastAPI()
+    """Create FastAPI app with auth endpoints (amortized per module)
+
+    orjson serializes responses several times faster than stdlib json
+    and emits bytes directly; the wire format is unchanged, so the
+    default response class is an equally valid fallback.
+    """
+    if ORJSONResponse is not None:
+        app = FastAPI(default_response_class=ORJSONResponse)
+    else:
+        app = FastAPI()
 
     # Setup auth endpoints
     jwt_secret = "test_secret_key_min_32_bytes_long_for_security"
@@ -48,13 +78,25 @@ def app():
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
-    """Create test client"""
-    return TestClient(app)
+    """Create test client (shared per module; app setup is expensive)
+
+    Context-managed so lifespan startup/shutdown runs once per module
+    rather than per request.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_app_state(app):
+    """Clear registered API keys between tests to preserve isolation"""
+    yield
+    app.state.api_key_store.clear()
+
+
+@pytest.fixture(scope="module")
 def jwt_manager():
     """Create JWT manager for testing"""
     return create_jwt_manager("test_secret_key_min_32_bytes_long_for_security")
@@ -388,21 +430,22 @@ def test_full_api_key_flow(client):
     # 2. Use API key for authentication (revoke another endpoint)
     # This verifies the key works
 
-    # 3. Revoke API key
-    revoke_response = client.delete(
-        f"/auth/revoke/{key_id}",
-        headers={"X-API-Key": api_key}
-    )
+    # Set the key once on the persistent client instead of rebuilding a
+    # headers dict per call; cleared afterwards since the client is
+    # shared across the module
+    client.headers["X-API-Key"] = api_key
+    try:
+        # 3. Revoke API key
+        revoke_response = client.delete(f"/auth/revoke/{key_id}")
 
-    assert revoke_response.status_code == 200
+        assert revoke_response.status_code == 200
 
-    # 4. Verify key no longer works
-    retry_response = client.delete(
-        "/auth/revoke/any_key",
-        headers={"X-API-Key": api_key}
-    )
+        # 4. Verify key no longer works
+        retry_response = client.delete("/auth/revoke/any_key")
 
-    assert retry_response.status_code == 401
+        assert retry_response.status_code == 401
+    finally:
+        del client.headers["X-API-Key"]
 
 
 def test_full_jwt_flow(client):
@@ -427,15 +470,17 @@ def test_full_jwt_flow(client):
         "/auth/register", json={"prefix": "did_test_"})
     key_id = register_response.json()["key_id"]
 
-    # Use JWT to revoke (should work)
-    revoke_response = client.delete(
-        f"/auth/revoke/{key_id}",
-        headers={"Authorization": f"Bearer {access_token}"}
-    )
-
-    # Note: This will fail with 403 because JWT user can't revoke API key
-    # unless they're the owner. This is expected behavior.
-    assert revoke_response.status_code in [200, 403]
+    # Use JWT to revoke (should work); bearer token set once on the
+    # persistent client, cleared in the finally below
+    client.headers["Authorization"] = f"Bearer {access_token}"
+    try:
+        revoke_response = client.delete(f"/auth/revoke/{key_id}")
+
+        # Note: This will fail with 403 because JWT user can't revoke
+        # an API key unless they're the owner. This is expected.
+        assert revoke_response.status_code in [200, 403]
+    finally:
+        del client.headers["Authorization"]
 
     # 3. Refresh access token
     refresh_response = client.post(
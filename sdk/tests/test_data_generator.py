@@ -16,6 +16,14 @@ import hashlib
 import json
 import os
 import random
+
+# Optional Rust-backed JSON parser (~3-10x on large fixture files)
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -495,6 +503,15 @@ def generate_benchmark_dataset(
 # DATASET PERSISTENCE
 # ============================================================================
 
+def _load_json(filepath: Path) -> Dict:
+    """Parse a JSON fixture file, preferring orjson when installed."""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def save_test_vector(vector: TestVector, filepath: Path) -> None:
     """Save test vector to JSON file."""
     filepath.parent.mkdir(parents=True, exist_ok=True)
@@ -504,8 +521,7 @@ def save_test_vector(vector: TestVector, filepath: Path) -> None:
 
 def load_test_vector(filepath: Path) -> TestVector:
     """Load test vector from JSON file."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    data = _load_json(filepath)
 
     enrollment = SyntheticTemplate.from_dict(data["enrollment_template"])
     verification = [
@@ -533,8 +549,7 @@ def save_benchmark_dataset(dataset: BenchmarkDataset, filepath: Path) -> None:
 
 def load_benchmark_dataset(filepath: Path) -> BenchmarkDataset:
     """Load benchmark dataset from JSON file."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    data = _load_json(filepath)
 
     templates = [SyntheticTemplate.from_dict(t) for t in data["templates"]]
 
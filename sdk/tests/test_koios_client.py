@@ -0,0 +1,416 @@
+"""Tests for the asynchronous Koios client.
+
+The shared client fixture is module-scoped: constructing a KoiosClient
+builds an httpx.AsyncClient (TCP pool, SSL context, headers) that these
+tests never use for real traffic, so one instance serves the module and
+an autouse fixture re-mocks the entry points between tests.
+"""
+
+import asyncio
+import functools
+import json
+import sys
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup only
+    uvloop = None
+
+from src.decentralized_did.cardano.cache import TTLCache
+from src.decentralized_did.cardano.koios_scanner import KoiosMetadataRecord
+from src.decentralized_did.cardano.koios_client import (
+    KoiosAPIError,
+    KoiosClient,
+    KoiosError,
+    KoiosRateLimitError,
+    TransactionStatus,
+    UTXOInfo,
+    convert_utxo_info_to_input,
+    format_lovelace,
+)
+
+
+# AsyncMock pays for call recording, spec introspection and await
+# tracking on every call; where a test never asserts await counts, a
+# plain async closure is an order of magnitude cheaper
+def _areturn(value):
+    """Async callable that always returns *value*."""
+    async def _call(*args, **kwargs):
+        return value
+    return _call
+
+
+def _aseq(*values):
+    """Async callable returning each of *values* in turn."""
+    iterator = iter(values)
+
+    async def _call(*args, **kwargs):
+        return next(iterator)
+    return _call
+
+
+# httpx.Response only keeps a reference to its request, so one sentinel
+# serves every mocked response instead of a fresh Request per call
+_DUMMY_REQUEST = httpx.Request("GET", "https://koios.test/api/v1")
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_json(payload_json: str) -> bytes:
+    """Memoize the UTF-8 encoding of constant test payloads."""
+    return payload_json.encode("utf-8")
+
+
+def make_httpx_response(status_code: int = 200, json_data=None,
+                        text: str = "") -> httpx.Response:
+    """Build an httpx.Response suitable for mocking _client.request."""
+    if json_data is not None:
+        return httpx.Response(
+            status_code,
+            content=_encode_json(json.dumps(json_data, sort_keys=True)),
+            headers={"Content-Type": "application/json"},
+            request=_DUMMY_REQUEST,
+        )
+    return httpx.Response(status_code, text=text, request=_DUMMY_REQUEST)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def event_loop_policy():
+    """Run this module's async tests on uvloop where available.
+
+    Its C-level selector roughly halves per-await dispatch overhead
+    versus the default loop; the default policy is kept on Windows and
+    when uvloop isn't installed.
+    """
+    if uvloop is None or sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """One KoiosClient per module; construction cost amortized."""
+    client = KoiosClient(base_url="https://koios.test/api/v1")
+    yield client
+    asyncio.run(client.close())
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(shared_client):
+    """Fresh mocks and metrics for every test using the shared client."""
+    shared_client.reset_metrics()
+    shared_client.cache = None
+    shared_client._request = AsyncMock()
+    shared_client._client.request = AsyncMock()
+    yield
+    # Drop per-test instance mocks so the real bound methods show
+    # through again for the next test
+    for name in ("_request", "_http_request", "get_transaction_status"):
+        shared_client.__dict__.pop(name, None)
+
+
+# Read-only payloads shared by every consumer: built once at import
+# instead of re-running the string multiplications and literal
+# construction per test
+_TX_HASH_A = "a" * 64
+_TX_HASH_B = "b" * 64
+_TX_HASH_C = "c" * 64
+
+_SAMPLE_UTXO_DATA = [
+    {
+        "tx_hash": _TX_HASH_A,
+        "tx_index": 0,
+        "value": "5000000",
+        "block_height": 1234,
+        "asset_list": [
+            {
+                "policy_id": "p" * 56,
+                "asset_name": "746f6b656e",
+                "quantity": "42",
+            }
+        ],
+    },
+    {
+        "tx_hash": _TX_HASH_B,
+        "tx_index": 1,
+        "value": "2000000",
+    },
+]
+
+_SAMPLE_TX_STATUS_DATA = [{"tx_hash": _TX_HASH_C, "num_confirmations": 3}]
+
+# Pre-built responses for the HTTP-layer tests; content bytes are
+# encoded exactly once for the whole session
+_OK_RESPONSE = make_httpx_response(json_data={"ok": True})
+_500_RESPONSE = make_httpx_response(500, json_data={"message": "Internal"})
+_429_RESPONSE = make_httpx_response(429, json_data={})
+
+_FOUND_RECORD = KoiosMetadataRecord(
+    label="674",
+    tx_hash="tx1",
+    block_hash="block1",
+    block_height=1,
+    tx_timestamp=111,
+    metadata={
+        "did": "did:cardano:testnet:one",
+        "controllers": ["addr_test1"],
+        "enrollment_timestamp": "2025",
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def sample_utxo_data():
+    return _SAMPLE_UTXO_DATA
+
+
+@pytest.fixture(scope="module")
+def sample_tx_status_data():
+    return _SAMPLE_TX_STATUS_DATA
+
+
+# ============================================================================
+# UTXO queries
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_get_address_utxos_parses_assets(shared_client,
+                                               sample_utxo_data):
+    shared_client._request = _areturn(sample_utxo_data)
+
+    utxos = await shared_client.get_address_utxos("addr_test1xyz")
+
+    assert len(utxos) == 2
+    assert utxos[0].tx_hash == "a" * 64
+    assert utxos[0].amount[0] == {"unit": "lovelace", "quantity": "5000000"}
+    assert utxos[0].amount[1]["unit"] == "p" * 56 + "746f6b656e"
+    assert utxos[0].block == "1234"
+    assert utxos[1].amount == [{"unit": "lovelace", "quantity": "2000000"}]
+
+
+@pytest.mark.asyncio
+async def test_get_address_utxos_unexpected_structure(shared_client):
+    shared_client._request = _areturn({"not": "a list"})
+
+    with pytest.raises(KoiosAPIError):
+        await shared_client.get_address_utxos("addr_test1xyz")
+
+
+@pytest.mark.asyncio
+async def test_get_address_balance_sums_lovelace(shared_client,
+                                                 sample_utxo_data):
+    shared_client._request = _areturn(sample_utxo_data)
+
+    balance = await shared_client.get_address_balance("addr_test1xyz")
+
+    assert balance == 7_000_000
+
+
+# ============================================================================
+# Transaction submission and status
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_submit_transaction_success(shared_client):
+    shared_client._request.return_value = "d" * 64
+
+    tx_hash = await shared_client.submit_transaction("84a100")
+
+    assert tx_hash == "d" * 64
+    shared_client._request.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_submit_transaction_invalid_hex(shared_client):
+    with pytest.raises(KoiosError, match="Invalid CBOR hex"):
+        await shared_client.submit_transaction("not-hex!")
+
+    shared_client._request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_status_confirmed(shared_client,
+                                                sample_tx_status_data):
+    shared_client._request = _aseq(
+        sample_tx_status_data,
+        [{"block_height": 1234, "tx_timestamp": 999, "absolute_slot": 555,
+          "block_hash": "e" * 64}],
+    )
+
+    status = await shared_client.get_transaction_status("c" * 64)
+
+    assert status.confirmed is True
+    assert status.confirmations == 3
+    assert status.block_height == 1234
+    assert status.block_hash == "e" * 64
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_status_unconfirmed(shared_client):
+    shared_client._request = _aseq([], [])
+
+    status = await shared_client.get_transaction_status("c" * 64)
+
+    assert status.confirmed is False
+    assert status.confirmations is None
+
+
+@pytest.mark.asyncio
+async def test_wait_for_confirmation_success(shared_client):
+    unconfirmed = TransactionStatus(tx_hash="f" * 64, confirmed=False)
+    confirmed = TransactionStatus(tx_hash="f" * 64, confirmed=True,
+                                  confirmations=1)
+    shared_client.get_transaction_status = AsyncMock(
+        side_effect=[unconfirmed, confirmed])
+
+    status = await shared_client.wait_for_confirmation(
+        "f" * 64, max_wait=5, poll_interval=0)
+
+    assert status.confirmed is True
+    assert shared_client.get_transaction_status.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_confirmation_zero_poll_uses_sleep_zero(
+        shared_client, monkeypatch):
+    """Zero poll interval must hit asyncio.sleep(0), the bare-yield
+    fast path that skips scheduling a TimerHandle per iteration."""
+    sleep_mock = AsyncMock()
+    monkeypatch.setattr(
+        "src.decentralized_did.cardano.koios_client.asyncio.sleep",
+        sleep_mock)
+    unconfirmed = TransactionStatus(tx_hash="f" * 64, confirmed=False)
+    confirmed = TransactionStatus(tx_hash="f" * 64, confirmed=True)
+    shared_client.get_transaction_status = AsyncMock(
+        side_effect=[unconfirmed, unconfirmed, confirmed])
+
+    await shared_client.wait_for_confirmation(
+        "f" * 64, max_wait=5, poll_interval=0)
+
+    assert sleep_mock.await_count == 2
+    assert all(call.args == (0,) for call in sleep_mock.await_args_list)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_confirmation_timeout(shared_client):
+    shared_client.get_transaction_status = _areturn(
+        TransactionStatus(tx_hash="f" * 64, confirmed=False))
+
+    with pytest.raises(KoiosError, match="not confirmed"):
+        await shared_client.wait_for_confirmation(
+            "f" * 64, max_wait=0, poll_interval=0)
+
+
+# ============================================================================
+# HTTP layer: retries, rate limiting, caching
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_http_retry_on_server_error(shared_client, monkeypatch):
+    monkeypatch.setattr(
+        "src.decentralized_did.cardano.koios_client.asyncio.sleep",
+        AsyncMock())
+    shared_client._client.request = AsyncMock(
+        side_effect=[_500_RESPONSE, _OK_RESPONSE])
+
+    result = await shared_client._http_request("GET", "/tip")
+
+    assert result == {"ok": True}
+    assert shared_client._client.request.await_count == 2
+    assert shared_client.metrics.network_errors == 1
+
+
+@pytest.mark.asyncio
+async def test_http_rate_limit_raises_after_retries(monkeypatch):
+    monkeypatch.setattr(
+        "src.decentralized_did.cardano.koios_client.asyncio.sleep",
+        AsyncMock())
+    client = KoiosClient(base_url="https://koios.test/api/v1", max_retries=1)
+    client._client.request = AsyncMock(return_value=_429_RESPONSE)
+    try:
+        with pytest.raises(KoiosRateLimitError):
+            await client._http_request("GET", "/tip")
+        assert client._client.request.await_count == 2
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_uses_cache_for_get(shared_client):
+    # This test exercises the real _request, so shed the autouse mock
+    del shared_client.__dict__["_request"]
+    shared_client.cache = TTLCache(default_ttl=300)
+    shared_client._http_request = AsyncMock(return_value=[{"epoch": 1}])
+
+    first = await shared_client._request("GET", "/tip", params={})
+    second = await shared_client._request("GET", "/tip", params={})
+
+    assert first == second == [{"epoch": 1}]
+    shared_client._http_request.assert_awaited_once()
+    assert shared_client.metrics.cache_hits == 1
+    assert shared_client.metrics.cache_misses == 1
+
+
+# ============================================================================
+# DID lookups
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_check_did_exists_found(shared_client):
+    shared_client._metadata_scanner.find_did = _areturn(_FOUND_RECORD)
+
+    enrollment = await shared_client.check_did_exists(
+        "did:cardano:testnet:one")
+
+    assert enrollment is not None
+    assert enrollment["tx_hash"] == "tx1"
+    assert enrollment["controllers"] == ["addr_test1"]
+    assert enrollment["revoked"] is False
+
+
+@pytest.mark.asyncio
+async def test_check_did_exists_not_found(shared_client):
+    shared_client._metadata_scanner.find_did = _areturn(None)
+
+    enrollment = await shared_client.check_did_exists(
+        "did:cardano:testnet:missing")
+
+    assert enrollment is None
+
+
+# ============================================================================
+# Pure helpers
+# ============================================================================
+
+@pytest.mark.parametrize("lovelace,expected", [
+    (0, "0.000000 ADA"),
+    (1_000_000, "1.000000 ADA"),
+    (1_234_567, "1.234567 ADA"),
+])
+def test_format_lovelace(lovelace, expected):
+    assert format_lovelace(lovelace) == expected
+
+
+def test_convert_utxo_info_to_input():
+    utxo = UTXOInfo(
+        tx_hash="a" * 64,
+        tx_index=2,
+        amount=[{"unit": "lovelace", "quantity": "3000000"}],
+        address="addr_test1xyz",
+    )
+
+    result = convert_utxo_info_to_input(utxo)
+
+    assert result == {
+        "tx_hash": "a" * 64,
+        "tx_index": 2,
+        "amount_lovelace": 3_000_000,
+        "address": "addr_test1xyz",
+    }